@@ -1,8 +1,18 @@
 ﻿import json
-from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
+try:
+    import yaml  # type: ignore
+except ImportError:
+    yaml = None
+
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+
+_DEFAULT_CONFIG_PATH = Path(__file__).resolve().parent / "config.yaml"
+
 DEFAULT_CONFIG: Dict[str, Any] = {
     "external_dependencies": {
         "llm_api": {
@@ -75,12 +85,24 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 }
 
 
+_MISSING = object()
+
+
 def _merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    result = deepcopy(base)
-    for key, val in (override or {}).items():
-        if isinstance(val, dict) and isinstance(result.get(key), dict):
-            result[key] = _merge(result[key], val)
+    # Builds fresh dicts top-down; untouched leaves are shared with `base`.
+    if not override:
+        return base
+    result: Dict[str, Any] = {}
+    for key, val in base.items():
+        over = override.get(key, _MISSING)
+        if over is _MISSING:
+            result[key] = val
+        elif isinstance(val, dict) and isinstance(over, dict):
+            result[key] = _merge(val, over)
         else:
+            result[key] = over
+    for key, val in override.items():
+        if key not in base:
             result[key] = val
     return result
 
@@ -88,23 +110,41 @@ def _merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
 def _load_from_file(path: Path) -> Dict[str, Any]:
     if not path.exists():
         return {}
-    text = path.read_text(encoding="utf-8")
     # Try PyYAML if available; fall back to JSON (valid YAML subset).
-    try:
-        import yaml  # type: ignore
-
-        return yaml.safe_load(text) or {}
-    except Exception:
+    if yaml is not None:
         try:
-            return json.loads(text)
+            # The loader decodes the binary stream itself, no intermediate str.
+            with path.open("rb") as fh:
+                return yaml.load(fh, Loader=_YAML_LOADER) or {}
         except Exception:
-            return {}
+            pass
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return -1
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    # mtime_ns is part of the cache key so edits to the file invalidate the entry.
+    return _merge(DEFAULT_CONFIG, _load_from_file(Path(path)))
 
 
 def load_config(path: Path | None = None) -> Dict[str, Any]:
-    cfg_path = path or Path(__file__).resolve().parent / "config.yaml"
-    file_cfg = _load_from_file(cfg_path)
-    return _merge(DEFAULT_CONFIG, file_cfg)
+    """Return the merged config; the result is cached and shared, treat it as read-only."""
+    cfg_path = path or _DEFAULT_CONFIG_PATH
+    mtime_ns = _mtime_ns(cfg_path)
+    if mtime_ns < 0:
+        # No config file: defaults apply as-is.
+        return DEFAULT_CONFIG
+    return _load_config_cached(str(cfg_path), mtime_ns)
 
 
 def get_palette_config(path: Path | None = None) -> Dict[str, Any]:
@@ -1,11 +1,45 @@
 import json
-from dataclasses import dataclass
+import struct
+from dataclasses import dataclass, field
 from typing import Optional, Tuple, List, Dict, Any
 
 from PySide6.QtGui import QImage
 
-
-@dataclass
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# JPEG start-of-frame markers (C0-CF minus DHT C4, JPG C8, DAC CC) carry the frame size.
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _image_dims(blob: bytes) -> Optional[Tuple[int, int]]:
+    """Read width/height from PNG/JPEG headers without decoding pixels."""
+    if blob.startswith(_PNG_SIGNATURE):
+        if len(blob) >= 24 and blob[12:16] == b"IHDR":
+            return struct.unpack(">II", blob[16:24])
+        return None
+    if blob.startswith(b"\xff\xd8"):
+        pos = 2
+        size = len(blob)
+        while pos + 4 <= size:
+            if blob[pos] != 0xFF:
+                return None
+            marker = blob[pos + 1]
+            if marker == 0xFF:
+                pos += 1
+                continue
+            if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+                pos += 2
+                continue
+            (seg_len,) = struct.unpack(">H", blob[pos + 2 : pos + 4])
+            if marker in _JPEG_SOF_MARKERS:
+                if pos + 9 > size:
+                    return None
+                height, width = struct.unpack(">HH", blob[pos + 5 : pos + 9])
+                return width, height
+            pos += 2 + seg_len
+    return None
+
+
+@dataclass(slots=True)
 class ClipItem:
     id: int
     content_type: str
@@ -24,60 +58,102 @@ class ClipItem:
     expanded_height: int = 0
     render_mode: str = ""  # ""| "rich" | "web"
     plugin_id: str = ""
-    extra_actions: List[Dict[str, Any]] = None
+    extra_actions: List[Dict[str, Any]] = field(default_factory=list)
+    # (content_text, preview_text, label) the label was built from; LabelRole reads it per paint.
+    _cached_label: Optional[Tuple[str, str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def label(self) -> str:
-        text_source = self.content_text or self.preview_text
-        text = (text_source or "").replace("\n", " ")
-        label = text[:160]
+        content, preview = self.content_text, self.preview_text
+        cached = self._cached_label
+        if cached is None or cached[0] is not content or cached[1] is not preview:
+            cached = self._cached_label = (content, preview, self._build_label())
+        return cached[2]
+
+    def _build_label(self) -> str:
+        # Slice before replacing so huge clips only cost the visible prefix.
+        text = (self.content_text or self.preview_text or "")[:161]
+        if not text:
+            return "[Empty]"
+        text = text.replace("\n", " ")
         if len(text) > 160:
-            label += "..."
-        return label or "[Empty]"
+            return text[:160] + "..."
+        return text
 
 
-@dataclass
+@dataclass(slots=True)
 class TextItem(ClipItem):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class HtmlItem(ClipItem):
-    def label(self) -> str:
-        text_source = self.content_text or self.preview_text
-        text = (text_source or "").replace("\n", " ")
-        label = text[:160] if text else "[HTML]"
+    def _build_label(self) -> str:
+        text = (self.content_text or self.preview_text or "")[:161]
+        if not text:
+            return "[HTML] [HTML]"
+        text = text.replace("\n", " ")
         if len(text) > 160:
-            label += "..."
-        return "[HTML] " + label
+            return "[HTML] " + text[:160] + "..."
+        return "[HTML] " + text
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageItem(ClipItem):
-    def label(self) -> str:
+    # (blob the size was read from, (width, height)); blobs can be swapped after previews load.
+    _cached_dims: Optional[Tuple[bytes, Tuple[int, int]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _dims(self) -> Optional[Tuple[int, int]]:
         blob = self.content_blob or self.preview_blob
-        if blob:
-            image = QImage.fromData(blob)
-            if not image.isNull():
-                return f"[IMG] {image.width()}x{image.height()}"
+        if not blob:
+            return None
+        cached = self._cached_dims
+        if cached is None or cached[0] is not blob:
+            dims = _image_dims(blob)
+            if dims is None:
+                image = QImage.fromData(blob)
+                dims = (0, 0) if image.isNull() else (image.width(), image.height())
+            cached = self._cached_dims = (blob, dims)
+        return cached[1]
+
+    def label(self) -> str:
+        dims = self._dims()
+        if dims and dims[0]:
+            return f"[IMG] {dims[0]}x{dims[1]}"
         return "[IMG]"
 
 
-@dataclass
+@dataclass(slots=True)
 class SvgItem(ClipItem):
     def label(self) -> str:
         return "[SVG]"
 
 
-@dataclass
+@dataclass(slots=True)
 class DrawioItem(ClipItem):
     def label(self) -> str:
         return "[DRAWIO]"
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorItem(ClipItem):
+    # (content_text the values were parsed from, (hex_value, label_text)).
+    _cached_parse: Optional[Tuple[str, Tuple[str, str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def _parsed(self) -> Tuple[str, str]:
         raw = self.content_text or ""
+        cached = self._cached_parse
+        if cached is None or cached[0] is not raw:
+            cached = self._cached_parse = (raw, self._parse(raw))
+        return cached[1]
+
+    @staticmethod
+    def _parse(raw: str) -> Tuple[str, str]:
         try:
             data = json.loads(raw)
             hex_value = str(data.get("hex") or "").strip() or "[COLOR]"
@@ -92,38 +168,49 @@ class ColorItem(ClipItem):
         return f"[COLOR] {label_text}"
 
 
+_ITEM_CLASSES: Dict[str, type] = {
+    "image": ImageItem,
+    "svg+xml": SvgItem,
+    "drawio": DrawioItem,
+    "html": HtmlItem,
+    "color": ColorItem,
+}
+_DEFAULT_ITEM_CLASS = TextItem
+
+
+def _row_to_dict(row) -> Dict[str, Any]:
+    if isinstance(row, dict):
+        return row
+    # sqlite3.Row: materialize keys once instead of per optional column.
+    return dict(zip(row.keys(), row))
+
+
 def item_from_row(row) -> ClipItem:
-    content_type = row["content_type"] or "text"
-    preview_text = str(row["preview_text"] or "")
-    has_full = bool(row["has_full_content"]) if "has_full_content" in row.keys() else True
-    base_kwargs = {
-        "id": int(row["id"]),
-        "content_type": content_type,
-        "content_text": str(row["content_text"] or ""),
-        "content_blob": row["content_blob"],
-        "created_at": int(row["created_at"]),
-        "pinned": bool(row["pinned"]),
-        "pinned_at": int(row["pinned_at"]) if row["pinned_at"] is not None else None,
-        "group_id": int(row["group_id"]),
-        "last_used_at": int(row["last_used_at"]) if row["last_used_at"] is not None else None,
-        "preview_text": preview_text,
-        "preview_blob": row["preview_blob"] if "preview_blob" in row.keys() else None,
-        "has_full_content": has_full,
-        "content_length": int(row["content_length"]) if "content_length" in row.keys() else len(str(row["content_text"] or "")),
-        "collapsed_height": int(row.get("collapsed_height", 0)) if hasattr(row, "get") else int(row["collapsed_height"]) if "collapsed_height" in row.keys() else 0,
-        "expanded_height": int(row.get("expanded_height", 0)) if hasattr(row, "get") else int(row["expanded_height"]) if "expanded_height" in row.keys() else 0,
-        "render_mode": str(row.get("render_mode", "")) if hasattr(row, "get") else str(row["render_mode"]) if "render_mode" in row.keys() else "",
-        "plugin_id": str(row.get("plugin_id", "")) if hasattr(row, "get") else str(row["plugin_id"]) if "plugin_id" in row.keys() else "",
-        "extra_actions": row.get("extra_actions", []) if hasattr(row, "get") else row["extra_actions"] if "extra_actions" in row.keys() else [],
-    }
-    if content_type == "image":
-        return ImageItem(**base_kwargs)
-    if content_type == "svg+xml":
-        return SvgItem(**base_kwargs)
-    if content_type == "drawio":
-        return DrawioItem(**base_kwargs)
-    if content_type == "html":
-        return HtmlItem(**base_kwargs)
-    if content_type == "color":
-        return ColorItem(**base_kwargs)
-    return TextItem(**base_kwargs)
+    data = _row_to_dict(row)
+    content_type = data["content_type"] or "text"
+    content_text = str(data["content_text"] or "")
+    pinned_at = data["pinned_at"]
+    last_used_at = data["last_used_at"]
+    content_length = data.get("content_length")
+    cls = _ITEM_CLASSES.get(content_type, _DEFAULT_ITEM_CLASS)
+    # Positional in ClipItem field order; avoids building a kwargs dict per row.
+    return cls(
+        int(data["id"]),
+        content_type,
+        content_text,
+        data["content_blob"],
+        int(data["created_at"]),
+        bool(data["pinned"]),
+        int(pinned_at) if pinned_at is not None else None,
+        int(data["group_id"]),
+        int(last_used_at) if last_used_at is not None else None,
+        str(data["preview_text"] or ""),
+        data.get("preview_blob"),
+        bool(data.get("has_full_content", True)),
+        int(content_length) if content_length is not None else len(content_text),
+        int(data.get("collapsed_height") or 0),
+        int(data.get("expanded_height") or 0),
+        str(data.get("render_mode") or ""),
+        str(data.get("plugin_id") or ""),
+        data.get("extra_actions") or [],
+    )
@@ -6,13 +6,11 @@ from PySide6.QtCore import Qt, QUrl
 from PySide6.QtGui import QFont, QGuiApplication, QIcon
 from PySide6.QtQml import QQmlApplicationEngine, qmlRegisterType
 from PySide6.QtQuickControls2 import QQuickStyle
-from PySide6.QtWebEngineQuick import QtWebEngineQuick
 from PySide6.QtWidgets import QApplication, QMenu, QSystemTrayIcon
 
 from config import get_palette_config, load_config
 from qml_backend import Backend
 from storage import Storage
-from ui.super_rich_text_item import SuperRichTextItem
 
 # Avoid non-integral scale factors that WebEngine rejects; override any env drift.
 os.environ["QT_SCALE_FACTOR"] = "1.0"
@@ -51,6 +49,10 @@ def _build_tray(
 
 
 def main() -> int:
+    # Deferred so importing this module does not load QtWebEngine; it must still
+    # be initialized before the application object is created.
+    from PySide6.QtWebEngineQuick import QtWebEngineQuick
+
     QtWebEngineQuick.initialize()
     QGuiApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.RoundPreferFloor
@@ -90,10 +92,15 @@ def main() -> int:
     app.aboutToQuit.connect(storage.close)
 
     print("Registering QML types...")
+    from ui.clip_image_provider import ClipImageProvider
+    from ui.super_rich_text_item import SuperRichTextItem
 
     qmlRegisterType(SuperRichTextItem, "cl_p", 1, 0, "SuperRichText")
 
     engine = QQmlApplicationEngine()
+    engine.addImageProvider(
+        "clips", ClipImageProvider([backend.clip_model, backend.plugin_clip_model])
+    )
     engine.rootContext().setContextProperty("backend", backend)
     engine.rootContext().setContextProperty("clipModel", backend.clip_model)
     engine.rootContext().setContextProperty(
@@ -1,11 +1,13 @@
 import base64
+import logging
+from functools import lru_cache
 from typing import Optional
 
 from openai import OpenAI
 
 from config import get_openai_settings
 
-settings = get_openai_settings()
+logger = logging.getLogger(__name__)
 
 PROMPTS = {
     "translate": "Translate the content into Chinese (if it's in another language) or English (if it's in Chinese). Only return the translated text.",
@@ -16,17 +18,41 @@ PROMPTS = {
     "ocr": "Perform Optical Character Recognition (OCR) on the provided image and extract the text. If the image contains equations, convert them into LaTeX format ($ ... $). Only return text inside the image.",
 }
 
+# Task name (lower-cased) -> prompt, including accepted aliases.
+_TASK_PROMPTS = {**PROMPTS, "summary": PROMPTS["summarize"]}
+
+
+_PNG_DATA_URL_PREFIX = b"data:image/png;base64,"
+
+# Static system prompt shared by every request; the SDK does not mutate it.
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": [
+        {
+            "type": "text",
+            "text": "You are a helpful assistant.",
+        }
+    ],
+}
+
 
 def _build_image_content(image: bytes) -> dict:
-    b64 = base64.b64encode(image).decode("ascii")
+    # Assemble the data URL as bytes and decode once to avoid an extra str copy of the payload.
+    url = (_PNG_DATA_URL_PREFIX + base64.b64encode(image)).decode("ascii")
     return {
         "type": "image_url",
         "image_url": {
-            "url": f"data:image/png;base64,{b64}",
+            "url": url,
         },
     }
 
 
+@lru_cache(maxsize=1)
+def _get_client(base_url: Optional[str], api_key: Optional[str], timeout: float) -> OpenAI:
+    # Reused across calls so the underlying HTTP connection pool stays warm.
+    return OpenAI(base_url=base_url, api_key=api_key, timeout=timeout)
+
+
 def llm_chat(
     text: str,
     image: Optional[bytes] = None,
@@ -36,30 +62,20 @@ def llm_chat(
     """
     Call the configured LLM with optional image context.
     """
+    settings = get_openai_settings()
     model = settings["models"].get(model_size, settings["models"]["medium"])
-    client = OpenAI(
-        base_url=settings.get("base_url"),
-        api_key=settings.get("api_key"),
-        timeout=settings.get("timeout", timeout),
+    client = _get_client(
+        settings.get("base_url"),
+        settings.get("api_key"),
+        settings.get("timeout", timeout),
     )
-    print(settings.get("base_url"), settings.get("api_key"))
+    logger.debug("llm base_url=%s model=%s", settings.get("base_url"), model)
 
     user_content: list[dict] = [{"type": "text", "text": text}]
     if image:
         user_content.append(_build_image_content(image))
 
-    messages = [
-        {
-            "role": "system",
-            "content": [
-                {
-                    "type": "text",
-                    "text": "You are a helpful assistant.",
-                }
-            ],
-        },
-        {"role": "user", "content": user_content},
-    ]
+    messages = [_SYSTEM_MESSAGE, {"role": "user", "content": user_content}]
 
     resp = client.chat.completions.create(
         model=model,
@@ -68,7 +84,8 @@ def llm_chat(
         temperature=0.6,
         timeout=timeout,
     )
-    print(resp)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("llm response usage=%s", getattr(resp, "usage", None))
     return resp.choices[0].message.content or ""
 
 
@@ -78,7 +95,9 @@ def run_task(
     """
     Run a specific LLM task (OCR, Translate, Summarize, etc.) with the given text and optional image.
     """
-    print("run_task:", task)
-    prompt = PROMPTS.get(task.lower(), None)
+    logger.debug("run_task: %s", task)
+    prompt = _TASK_PROMPTS.get(task.lower())
+    if prompt is None:
+        raise ValueError(f"Unknown task: {task}")
     full_prompt = prompt + (f"\n\nContent:\n{text}" if text else "")
     return llm_chat(full_prompt, image=image, model_size="medium", timeout=timeout)
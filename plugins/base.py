@@ -1,8 +1,34 @@
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import List
+from dataclasses import replace
+from functools import lru_cache
+from typing import Hashable, List, Optional, Tuple
 
+from config import load_config
 from item import ClipItem
 
+DEFAULT_FONT_FAMILY = "Cascadia Code, 'Segoe UI', sans-serif"
+
+# __NAME__ placeholders in plugin page templates.
+_PLACEHOLDER_RE = re.compile(r"__([A-Z]+)__")
+
+
+def font_family() -> str:
+    """UI font family for plugin pages; load_config() is cached per config mtime."""
+    return load_config().get("ui", {}).get("fontFamily") or DEFAULT_FONT_FAMILY
+
+
+@lru_cache(maxsize=32)
+def render_page(template: str, font: str, **values: str) -> Tuple[bytes, int]:
+    """
+    Fill __FONT__ and any __NAME__ placeholders given as keywords in one pass.
+    Returns the UTF-8 page and its character length; values must already be escaped.
+    """
+    subs = {"FONT": font, **values}
+    html = _PLACEHOLDER_RE.sub(lambda m: subs.get(m.group(1), m.group(0)), template)
+    return html.encode("utf-8"), len(html)
+
 
 class Plugin(ABC):
     """Minimal interface for pluggable features shown in the Plugins group."""
@@ -11,6 +37,8 @@ class Plugin(ABC):
     display_name: str
     # Whether build_items relies on current clipboard text.
     uses_clipboard: bool = True
+    # First item id for this plugin; assigned by PluginManager.register.
+    _id_base: int = -1000
 
     def __init__(self, group_id: int) -> None:
         self.group_id = group_id
@@ -20,6 +48,14 @@ class Plugin(ABC):
         """Return virtual ClipItem rows to render for this plugin."""
         raise NotImplementedError
 
+    def cache_key(self, clipboard_text: str) -> Optional[Hashable]:
+        """
+        Key identifying what build_items would render for this input.
+        The manager reuses the previous items while the key (plus the UI font) is
+        unchanged; None disables reuse.
+        """
+        return None
+
     def on_action(self, action_id: str, backend, payload=None) -> bool:
         """Handle a context-menu action. Return True if handled."""
         return False
@@ -32,3 +68,48 @@ class Plugin(ABC):
     def on_clipboard_changed(self, clipboard_text: str) -> None:
         """Optional hook fired when the clipboard text changes."""
         return
+
+
+class StaticPagePlugin(Plugin):
+    """
+    Plugin rendering one fixed web page. The item is prebuilt once per font;
+    each build only stamps created_at on a copy.
+    """
+
+    uses_clipboard = False
+    # Page template (with __FONT__) and item presentation; set by subclasses.
+    page_html: str
+    page_title: str
+    page_preview: str
+    collapsed_height: int
+    expanded_height: int
+    # (font, item) for the last font the page was rendered with.
+    _template: Optional[Tuple[str, ClipItem]] = None
+
+    def _template_for(self, font: str) -> ClipItem:
+        if self._template is None or self._template[0] != font:
+            html_bytes, html_len = render_page(self.page_html, font)
+            item = ClipItem(
+                id=self._id_base,
+                content_type="html",
+                content_text=self.page_title,
+                content_blob=html_bytes,
+                created_at=0,
+                pinned=False,
+                pinned_at=None,
+                group_id=self.group_id,
+                preview_text=self.page_preview,
+                preview_blob=None,
+                has_full_content=True,
+                content_length=html_len,
+                collapsed_height=self.collapsed_height,
+                expanded_height=self.expanded_height,
+                render_mode="web",
+                plugin_id=self.plugin_id,
+                extra_actions=[],
+            )
+            self._template = (font, item)
+        return self._template[1]
+
+    def build_items(self, clipboard_text: str) -> List[ClipItem]:
+        return [replace(self._template_for(font_family()), created_at=int(time.time()))]
@@ -1,17 +1,9 @@
 ﻿import time
 from typing import Callable, List
 
-from config import load_config
 from item import ClipItem
 
-from .base import Plugin
-
-
-def _font_family() -> str:
-    return (
-        load_config().get("ui", {}).get("fontFamily")
-        or "Cascadia Code, 'Segoe UI', sans-serif"
-    )
+from .base import Plugin, font_family, render_page
 
 
 HTML = """<!doctype html>
@@ -179,6 +171,8 @@ HTML = """<!doctype html>
       expr.addEventListener(ev, syncCaret)
     );
 
+    const factCache = [1, 1];
+    const FACT_MAX = 170; // 171! overflows a double
     const fnMap = {
       sin: Math.sin,
       cos: Math.cos,
@@ -192,9 +186,10 @@ HTML = """<!doctype html>
         n = Number(n);
         if (!Number.isFinite(n) || n < 0) throw new Error("Factorial requires non-negative integer");
         if (Math.floor(n) !== n) throw new Error("Factorial requires an integer");
-        let r = 1;
-        for (let i = 2; i <= n; i++) r *= i;
-        return r;
+        if (n > FACT_MAX) return Infinity;
+        // Extend the shared table incrementally; earlier results stay cached.
+        for (let i = factCache.length; i <= n; i++) factCache.push(factCache[i - 1] * i);
+        return factCache[n];
       },
     };
 
@@ -216,16 +211,32 @@ HTML = """<!doctype html>
       return raw.replace(/\^/g, "**");
     }
 
+    // Compiled expressions keyed by sanitized source; oldest entry evicted first.
+    const fnArgNames = Object.keys(fnMap);
+    const fnArgValues = Object.values(fnMap);
+    const fnCache = new Map();
+    const FN_CACHE_MAX = 64;
+    // Results of successful evaluations keyed by the trimmed raw input.
+    const resultCache = new Map();
+    const RESULT_CACHE_MAX = 128;
+
     function compute() {
       const raw = (expr.value || "").trim();
       if (!raw) { setResult("0"); return; }
+      const cached = resultCache.get(raw);
+      if (cached !== undefined) { setResult(cached); return; }
       try {
         const cleaned = sanitize(raw);
-        const argNames = Object.keys(fnMap);
-        const argValues = Object.values(fnMap);
-        const fn = new Function(...argNames, `"use strict"; return (${cleaned});`);
-        const val = fn(...argValues);
-        setResult(String(val));
+        let fn = fnCache.get(cleaned);
+        if (!fn) {
+          fn = new Function(...fnArgNames, `"use strict"; return (${cleaned});`);
+          if (fnCache.size >= FN_CACHE_MAX) fnCache.delete(fnCache.keys().next().value);
+          fnCache.set(cleaned, fn);
+        }
+        const val = String(fn(...fnArgValues));
+        if (resultCache.size >= RESULT_CACHE_MAX) resultCache.delete(resultCache.keys().next().value);
+        resultCache.set(raw, val);
+        setResult(val);
       } catch (e) {
         setError(e?.message || "Error");
       }
@@ -256,7 +267,35 @@ HTML = """<!doctype html>
       syncCaret();
     }
 
+    // Appended keys are buffered and written once per animation frame, so key
+    // bursts cost one DOM write + compute. Anything that reads the field flushes first.
+    let pendingValue = null;
+    let pendingFrame = 0;
+
+    function flushValue() {
+      if (pendingFrame) { cancelAnimationFrame(pendingFrame); pendingFrame = 0; }
+      if (pendingValue === null) return;
+      expr.value = pendingValue;
+      pendingValue = null;
+      const len = expr.value.length;
+      expr.setSelectionRange(len, len);
+      syncCaret();
+      compute();
+    }
+
+    function appendValue(text) {
+      pendingValue = (pendingValue !== null ? pendingValue : (expr.value || "")) + text;
+      if (!pendingFrame) pendingFrame = requestAnimationFrame(() => { pendingFrame = 0; flushValue(); });
+    }
+
     function handleKey(key) {
+      // default insert
+      if (key !== "=" && key !== "C" && (key.length === 1 || key.endsWith("(") || key === "^")) {
+        appendValue(key);
+        return;
+      }
+      flushValue();
+
       if (key === "=" || key === "Enter") { compute(); return; }
 
       if (key === "C") { expr.value = ""; setResult("0"); syncCaret(); return; }
@@ -308,13 +347,6 @@ HTML = """<!doctype html>
         compute();
         return;
       }
-
-      // default insert
-      if (key.length === 1 || key.endsWith("(") || key === "^") {
-        expr.value += key;
-        syncCaret();
-        compute();
-      }
     }
 
     document.querySelectorAll("button.key").forEach((btn) => {
@@ -322,6 +354,7 @@ HTML = """<!doctype html>
     });
 
     expr.addEventListener("keydown", (e) => {
+      flushValue();
       if (e.key === "Enter") {
         e.preventDefault();
         compute();
@@ -336,32 +369,37 @@ HTML = """<!doctype html>
       // allow other keys; sanitize at compute time
     });
 
-    expr.addEventListener("input", compute);
+    // Trailing-edge debounce: typing bursts compile the expression once.
+    function debounce(fn, ms) {
+      let timer = 0;
+      return (...args) => {
+        clearTimeout(timer);
+        timer = setTimeout(() => fn(...args), ms);
+      };
+    }
+    expr.addEventListener("input", debounce(compute, 80));
 
     document.addEventListener("keydown", (e) => {
       if (document.activeElement === expr) return;
       if (e.ctrlKey || e.metaKey || e.altKey) return;
 
-      if (e.key === "Enter") {
+      if (e.key && e.key.length === 1) {
         e.preventDefault();
         expr.focus();
-        compute();
+        appendValue(e.key);
         return;
       }
-      if (e.key === "Backspace") {
+      flushValue();
+      if (e.key === "Enter") {
         e.preventDefault();
         expr.focus();
-        deleteAtCaret();
         compute();
         return;
       }
-      if (e.key && e.key.length === 1) {
+      if (e.key === "Backspace") {
         e.preventDefault();
         expr.focus();
-        expr.value += e.key;
-        const len = expr.value.length;
-        expr.setSelectionRange(len, len);
-        syncCaret();
+        deleteAtCaret();
         compute();
       }
     }, { capture: true });
@@ -398,14 +436,13 @@ class CalculatorPlugin(Plugin):
 
     def build_items(self, clipboard_text: str) -> List[ClipItem]:
         now = int(time.time())
-        font = _font_family()
-        html = HTML.replace("__FONT__", font)
+        html_bytes, html_len = render_page(HTML, font_family())
         return [
             ClipItem(
                 id=-1000,
                 content_type="html",
                 content_text="Calculator",
-                content_blob=html.encode("utf-8"),
+                content_blob=html_bytes,
                 created_at=now,
                 pinned=False,
                 pinned_at=None,
@@ -413,7 +450,7 @@ class CalculatorPlugin(Plugin):
                 preview_text="Calculator",
                 preview_blob=None,
                 has_full_content=True,
-                content_length=len(html),
+                content_length=html_len,
                 collapsed_height=495,
                 expanded_height=495,
                 render_mode="web",
@@ -1,17 +1,6 @@
-import time
-from typing import Callable, List
+from typing import Callable
 
-from config import load_config
-from item import ClipItem
-
-from .base import Plugin
-
-
-def _font_family() -> str:
-    return (
-        load_config().get("ui", {}).get("fontFamily")
-        or "Cascadia Code, 'Segoe UI', sans-serif"
-    )
+from .base import StaticPagePlugin
 
 
 HTML = """<!doctype html>
@@ -90,39 +79,18 @@ HTML = """<!doctype html>
 """
 
 
-class ChatGPTPlugin(Plugin):
+class ChatGPTPlugin(StaticPagePlugin):
     plugin_id = "chatgpt"
     display_name = "ChatGPT"
-    uses_clipboard = False
+    page_html = HTML
+    page_title = "ChatGPT"
+    page_preview = "ChatGPT"
+    collapsed_height = 495
+    expanded_height = 495
 
     def __init__(self, group_id: int, refresh_callback: Callable[[], None]) -> None:
         super().__init__(group_id)
         self._refresh_callback = refresh_callback
 
-    def build_items(self, clipboard_text: str) -> List[ClipItem]:
-        now = int(time.time())
-        html = HTML.replace("__FONT__", _font_family())
-        return [
-            ClipItem(
-                id=-1001,
-                content_type="html",
-                content_text="ChatGPT",
-                content_blob=html.encode("utf-8"),
-                created_at=now,
-                pinned=False,
-                pinned_at=None,
-                group_id=self.group_id,
-                preview_text="ChatGPT",
-                preview_blob=None,
-                has_full_content=True,
-                content_length=len(html),
-                collapsed_height=495,
-                expanded_height=495,
-                render_mode="web",
-                plugin_id=self.plugin_id,
-                extra_actions=[],
-            )
-        ]
-
     def on_action(self, action_id: str, backend, payload=None) -> bool:
         return False
@@ -1,10 +1,14 @@
+import colorsys
 import time
-from typing import Callable, List
+from functools import lru_cache
+from typing import Callable, List, Tuple
 
-from config import load_config
 from item import ClipItem
 
-from .base import Plugin
+from .base import Plugin, font_family, render_page
+
+DEFAULT_HEX = "#FACC15"
+DEFAULT_FG = "#0d1117"
 
 HTML_TEMPLATE = """<!doctype html>
 <html>
@@ -109,6 +113,7 @@ HTML_TEMPLATE = """<!doctype html>
 
     let h = 50 / 360, s = 1, v = 1; // defaults, replaced by initialHex below
     let lastColor = initialHex;
+    let lastColorCache = { hex: "", fg: "#e6edf3", rgb: "" };
 
     function clamp(v, min=0, max=1) { return Math.min(max, Math.max(min, v)); }
 
@@ -160,9 +165,13 @@ HTML_TEMPLATE = """<!doctype html>
       svCtx.fillRect(0, 0, width, height);
     }
 
-    function redrawHue() {
-      const {width, height} = hue;
-      const grad = hueCtx.createLinearGradient(0,0,width,0);
+    // The hue strip only depends on width: paint it once offscreen, then stretch-blit.
+    const hueStrip = document.createElement('canvas');
+    hueStrip.width = 1024;
+    hueStrip.height = 1;
+    (function paintHueStrip() {
+      const ctx = hueStrip.getContext('2d');
+      const grad = ctx.createLinearGradient(0,0,hueStrip.width,0);
       grad.addColorStop(0.0, '#ff0000');
       grad.addColorStop(0.17, '#ffff00');
       grad.addColorStop(0.34, '#00ff00');
@@ -170,8 +179,14 @@ HTML_TEMPLATE = """<!doctype html>
       grad.addColorStop(0.67, '#0000ff');
       grad.addColorStop(0.84, '#ff00ff');
       grad.addColorStop(1.0, '#ff0000');
-      hueCtx.fillStyle = grad;
-      hueCtx.fillRect(0,0,width,height);
+      ctx.fillStyle = grad;
+      ctx.fillRect(0,0,hueStrip.width,hueStrip.height);
+    })();
+
+    function redrawHue() {
+      const {width, height} = hue;
+      hueCtx.imageSmoothingEnabled = true;
+      hueCtx.drawImage(hueStrip, 0, 0, width, height);
     }
 
     function updateOutput() {
@@ -185,13 +200,17 @@ HTML_TEMPLATE = """<!doctype html>
       swatch.style.background = hex;
       swatch.style.color = fg;
       if (lastColor) {
+        // lastColor only changes on mousedown/mouseup; reparse it only then.
+        if (lastColorCache.hex !== lastColor) {
+          const lc = lastColor;
+          const llum = (0.299*parseInt(lc.slice(1,3),16) + 0.587*parseInt(lc.slice(3,5),16) + 0.114*parseInt(lc.slice(5,7),16)) / 255;
+          const [lr, lg, lb] = hexToRgb(lc);
+          lastColorCache = { hex: lc, fg: llum > 0.6 ? '#0d1117' : '#e6edf3', rgb: `rgb(${lr}, ${lg}, ${lb})` };
+        }
         lastSwatch.style.background = lastColor;
-        const lc = lastColor;
-        const llum = (0.299*parseInt(lc.slice(1,3),16) + 0.587*parseInt(lc.slice(3,5),16) + 0.114*parseInt(lc.slice(5,7),16)) / 255;
-        lastSwatch.style.color = llum > 0.6 ? '#0d1117' : '#e6edf3';
+        lastSwatch.style.color = lastColorCache.fg;
         lastHex.textContent = lastColor;
-        const [lr, lg, lb] = hexToRgb(lastColor);
-        lastRgb.textContent = `rgb(${lr}, ${lg}, ${lb})`;
+        lastRgb.textContent = lastColorCache.rgb;
       }
     }
 
@@ -204,11 +223,19 @@ HTML_TEMPLATE = """<!doctype html>
       updateOutput();
     }
 
+    const HUE_BUCKETS = 256;
+    let lastHueBucket = -1;
+
     function pickHue(evt) {
       const rect = hue.getBoundingClientRect();
       const x = clamp((evt.clientX - rect.left) / rect.width);
       h = x;
-      redrawSV();
+      // The SV gradient only changes visibly between hue buckets.
+      const bucket = (h * HUE_BUCKETS) | 0;
+      if (bucket !== lastHueBucket) {
+        lastHueBucket = bucket;
+        redrawSV();
+      }
       updateOutput();
     }
 
@@ -227,22 +254,57 @@ HTML_TEMPLATE = """<!doctype html>
       lastSwatch.style.display = "flex";
     }
 
-    sv.addEventListener('mousedown', (e)=>{ startDrag(); pickSV(e); sv.onmousemove = pickSV; });
+    function debounce(fn, ms) {
+      let timer = 0;
+      return (...args) => {
+        clearTimeout(timer);
+        timer = setTimeout(() => fn(...args), ms);
+      };
+    }
+
+    // Coalesce mousemove bursts into one pick per animation frame (latest event wins).
+    function perFrame(fn) {
+      let frame = 0;
+      let lastEvt = null;
+      const run = () => { frame = 0; fn(lastEvt); };
+      const schedule = (evt) => {
+        lastEvt = evt;
+        if (!frame) frame = requestAnimationFrame(run);
+      };
+      // Apply a still-pending event right away instead of on the next frame.
+      schedule.flush = () => {
+        if (!frame) return;
+        cancelAnimationFrame(frame);
+        run();
+      };
+      return schedule;
+    }
+    const pickSVPerFrame = perFrame(pickSV);
+    const pickHuePerFrame = perFrame(pickHue);
+    // mouseup must see the final drag position before it reads the picked color.
+    function flushPicks() {
+      pickSVPerFrame.flush();
+      pickHuePerFrame.flush();
+    }
+
+    sv.addEventListener('mousedown', (e)=>{ startDrag(); pickSV(e); sv.onmousemove = pickSVPerFrame; });
     window.addEventListener('mouseup', ()=>{
+      flushPicks();
       sv.onmousemove = null;
       lastColor = hexEl.textContent || lastColor;
       lastSwatch.style.display = "none";
       updateOutput();
     });
-    hue.addEventListener('mousedown', (e)=>{ startDrag(); pickHue(e); hue.onmousemove = pickHue; });
+    hue.addEventListener('mousedown', (e)=>{ startDrag(); pickHue(e); hue.onmousemove = pickHuePerFrame; });
     window.addEventListener('mouseup', ()=>{
+      flushPicks();
       hue.onmousemove = null;
       lastColor = hexEl.textContent || lastColor;
       lastSwatch.style.display = "none";
       updateOutput();
     });
 
-    window.addEventListener('resize', resize);
+    window.addEventListener('resize', debounce(resize, 60));
 
     (function initFromHex(){
       const hsv = hexToHsv(initialHex);
@@ -268,6 +330,18 @@ HTML_TEMPLATE = """<!doctype html>
 """
 
 
+@lru_cache(maxsize=256)
+def _hex_to_rgb(hex_value: str) -> Tuple[int, int, int]:
+    return int(hex_value[1:3], 16), int(hex_value[3:5], 16), int(hex_value[5:7], 16)
+
+
+@lru_cache(maxsize=256)
+def _hex_to_hsl(hex_value: str) -> str:
+    r, g, b = (c / 255.0 for c in _hex_to_rgb(hex_value))
+    h, l, s = colorsys.rgb_to_hls(r, g, b)
+    return f"hsl({round(h * 360)}, {round(s * 100)}%, {round(l * 100)}%)"
+
+
 class ColorPickerPlugin(Plugin):
     plugin_id = "colorpicker"
     display_name = "Color Picker"
@@ -284,16 +358,8 @@ class ColorPickerPlugin(Plugin):
     def build_items(self, clipboard_text: str) -> List[ClipItem]:
         print("building colorpickers")
         now = int(time.time())
-        default_hex = "#FACC15"
-        fg = "#0d1117"
-        font_family = (
-            load_config().get("ui", {}).get("fontFamily")
-            or "Cascadia Code, 'Segoe UI', sans-serif"
-        )
-        html = (
-            HTML_TEMPLATE.replace("__HEX__", default_hex)
-            .replace("__FG__", fg)
-            .replace("__FONT__", font_family)
+        html_bytes, html_len = render_page(
+            HTML_TEMPLATE, font_family(), HEX=DEFAULT_HEX, FG=DEFAULT_FG
         )
         actions = [
             {"id": "copy_hex", "text": "Paste as HEX"},
@@ -305,8 +371,8 @@ class ColorPickerPlugin(Plugin):
             ClipItem(
                 id=-1000,
                 content_type="html",
-                content_text=default_hex,
-                content_blob=html.encode("utf-8"),
+                content_text=DEFAULT_HEX,
+                content_blob=html_bytes,
                 created_at=now,
                 pinned=False,
                 pinned_at=None,
@@ -314,7 +380,7 @@ class ColorPickerPlugin(Plugin):
                 preview_text="Color Picker",
                 preview_blob=None,
                 has_full_content=True,
-                content_length=len(html),
+                content_length=html_len,
                 collapsed_height=150,
                 expanded_height=150,
                 render_mode="web",
@@ -333,7 +399,7 @@ class ColorPickerPlugin(Plugin):
 
         # Fallback to stored base color
         if not hex_value:
-            hex_value = backend.getPluginBaseColor(self.plugin_id) or "#FACC15"
+            hex_value = backend.getPluginBaseColor(self.plugin_id) or DEFAULT_HEX
         hex_value = hex_value.upper()
 
         if action_id == "copy_hex":
@@ -343,9 +409,7 @@ class ColorPickerPlugin(Plugin):
         if action_id == "copy_rgb":
             if not rgb_value:
                 try:
-                    r = int(hex_value[1:3], 16)
-                    g = int(hex_value[3:5], 16)
-                    b = int(hex_value[5:7], 16)
+                    r, g, b = _hex_to_rgb(hex_value)
                     rgb_value = f"rgb({r}, {g}, {b})"
                 except Exception:
                     rgb_value = ""
@@ -354,38 +418,12 @@ class ColorPickerPlugin(Plugin):
                 return True
             return False
         if action_id == "copy_hsl":
-            if not rgb_value:
-                try:
-                    r = int(hex_value[1:3], 16) / 255.0
-                    g = int(hex_value[3:5], 16) / 255.0
-                    b = int(hex_value[5:7], 16) / 255.0
-                    max_c = max(r, g, b)
-                    min_c = min(r, g, b)
-                    l = (max_c + min_c) / 2.0
-                    if max_c == min_c:
-                        h = s = 0.0
-                    else:
-                        d = max_c - min_c
-                        s = (
-                            d / (2.0 - max_c - min_c)
-                            if l > 0.5
-                            else d / (max_c + min_c)
-                        )
-                        if max_c == r:
-                            h = (g - b) / d + (6 if g < b else 0)
-                        elif max_c == g:
-                            h = (b - r) / d + 2
-                        else:
-                            h = (r - g) / d + 4
-                        h /= 6.0
-                    h_deg = round(h * 360)
-                    s_perc = round(s * 100)
-                    l_perc = round(l * 100)
-                    rgb_value = f"hsl({h_deg}, {s_perc}%, {l_perc}%)"
-                except Exception:
-                    rgb_value = ""
-            if rgb_value:
-                backend.plugin_set_clipboard_and_paste(rgb_value)
+            try:
+                hsl_value = _hex_to_hsl(hex_value)
+            except Exception:
+                hsl_value = ""
+            if hsl_value:
+                backend.plugin_set_clipboard_and_paste(hsl_value)
                 return True
             return False
 
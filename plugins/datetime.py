@@ -1,26 +1,16 @@
+import time
 from datetime import datetime, timezone
+from typing import Hashable
 
 from item import ClipItem
 
 from .base import Plugin
 
+_DATE_FMT = "%Y-%m-%d"
+_TS_FMT = "%Y-%m-%d %H:%M:%S"
+_FRIENDLY_FMT = "%A, %B %d, %Y %I:%M:%S %p %Z"
 
-class DateTimePlugin(Plugin):
-    plugin_id = "datetime"
-    display_name = "Date & Time"
-    uses_clipboard = False
-
-    def __init__(self, group_id: int) -> None:
-        super().__init__(group_id)
-
-    def build_items(self, clipboard_text: str) -> list[ClipItem]:
-        now = datetime.now().astimezone()
-        iso_stamp = now.isoformat(timespec="seconds")
-        friendly = now.strftime("%A, %B %d, %Y %I:%M:%S %p %Z")
-        date_only = now.strftime("%Y-%m-%d")
-        ts = now.strftime("%Y-%m-%d %H:%M:%S")
-        html_body = f"""
-<!doctype html>
+_HTML_TEMPLATE = """<!doctype html>
 <html>
 <head>
   <meta charset="utf-8" />
@@ -87,20 +77,43 @@ class DateTimePlugin(Plugin):
     </div>
   </div>
 </body>
-</html>
-        """
+</html>"""
+
+
+class DateTimePlugin(Plugin):
+    plugin_id = "datetime"
+    display_name = "Date & Time"
+    uses_clipboard = False
+
+    def __init__(self, group_id: int) -> None:
+        super().__init__(group_id)
+
+    def cache_key(self, clipboard_text: str) -> Hashable:
+        # The card shows seconds; anything finer would never hit.
+        return int(time.time())
+
+    def build_items(self, clipboard_text: str) -> list[ClipItem]:
+        now = datetime.now().astimezone()
+        iso_stamp = now.isoformat(timespec="seconds")
+        friendly = now.strftime(_FRIENDLY_FMT)
+        ts = now.strftime(_TS_FMT)
+        date_only = ts[:10]  # _TS_FMT starts with _DATE_FMT
+        html_body = _HTML_TEMPLATE.format(
+            friendly=friendly, iso_stamp=iso_stamp, date_only=date_only, ts=ts
+        )
+        html_blob = html_body.encode("utf-8")
         return [
             ClipItem(
                 id=-1001,
                 content_type="html",
                 content_text=friendly,
-                content_blob=html_body.encode("utf-8"),
+                content_blob=html_blob,
                 created_at=int(now.timestamp()),
                 pinned=False,
                 pinned_at=None,
                 group_id=self.group_id,
                 preview_text=friendly,
-                preview_blob=html_body.encode("utf-8"),
+                preview_blob=html_blob,
                 has_full_content=True,
                 content_length=len(friendly),
                 collapsed_height=140,
@@ -117,9 +130,9 @@ class DateTimePlugin(Plugin):
     def on_action(self, action_id: str, backend, payload=None) -> bool:
         now = datetime.now().astimezone()
         if action_id == "paste-date":
-            backend.plugin_set_clipboard_and_paste(now.strftime("%Y-%m-%d"))
+            backend.plugin_set_clipboard_and_paste(now.strftime(_DATE_FMT))
             return True
         if action_id == "paste-ts":
-            backend.plugin_set_clipboard_and_paste(now.strftime("%Y-%m-%d %H:%M:%S"))
+            backend.plugin_set_clipboard_and_paste(now.strftime(_TS_FMT))
             return True
         return False
@@ -1,15 +1,18 @@
 import importlib.util
 import os
+import queue
 import re
 import sys
+import threading
 import time
+from collections import OrderedDict, deque
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Dict, Optional, Tuple
+from typing import Callable, Hashable, Optional, Tuple
 
-import simplemma
 from PySide6.QtCore import QThread, QTimer, Signal
 
-from config import get_dictionary_settings
+from config import load_config
 from item import ClipItem
 from utils.general import truncate_text
 from utils.html import normalize_html_for_qt
@@ -19,17 +22,18 @@ from .base import Plugin
 # Vendored mdict-query helper (moved from utils/dict.py)
 REPO_ROOT = Path(__file__).resolve().parent.parent
 VENDOR_MDICT = REPO_ROOT / "vendors" / "mdict-query"
-_DICT_CFG = get_dictionary_settings()
+_CFG = load_config()
+_DICT_CFG = _CFG.get("plugins", {}).get("dictionary", {})
 MDX_PATH = Path(_DICT_CFG.get("mdxPath", "")).expanduser()
 # UI font (used for helper messages).
-_UI_FONT = (
-    get_dictionary_settings.__globals__["load_config"]()  # type: ignore
-    .get("ui", {})
-    .get("fontFamily")
-    or "Cascadia Code"
-)
+_UI_FONT = _CFG.get("ui", {}).get("fontFamily") or "Cascadia Code"
 
+_SEGMENT_SPLIT_RE = re.compile(r"[,\n]+")
+_WORD_RE = re.compile(r"[A-Za-z][A-Za-z'\\-]*")
+_TAG_RE = re.compile(r"<[^>]+>")
 
+
+@lru_cache(maxsize=1)
 def _load_mdict_module():
     if not (VENDOR_MDICT / "mdict_query.py").exists():
         raise ImportError("mdict_query.py not found in vendors/mdict-query")
@@ -47,34 +51,61 @@ def _load_mdict_module():
     return module
 
 
+_MDICT_BUILDER = None
+_MDICT_LOCK = threading.Lock()
+
+
+def _get_index_builder():
+    """Return the shared IndexBuilder, building the index on first use."""
+    global _MDICT_BUILDER
+    with _MDICT_LOCK:
+        if _MDICT_BUILDER is None:
+            IndexBuilder = _load_mdict_module().IndexBuilder
+            if not MDX_PATH:
+                raise FileNotFoundError(
+                    "Dictionary path not configured. Set dictionary.mdxPath in config.yaml."
+                )
+            mdx_path_str = str(MDX_PATH)
+            if not MDX_PATH.exists():
+                raise FileNotFoundError(f"Dictionary file not found at {mdx_path_str}")
+
+            builder = IndexBuilder(mdx_path_str)
+            if not os.path.exists(mdx_path_str + ".sqlite.db"):
+                builder.make_sqlite()
+            _MDICT_BUILDER = builder
+        return _MDICT_BUILDER
+
+
 def get_definition(word: str) -> str:
     """Lookup a word in the mdict dictionary and return its definition."""
-    mdict_module = _load_mdict_module()
-    IndexBuilder = mdict_module.IndexBuilder
-    if not MDX_PATH:
-        raise FileNotFoundError(
-            "Dictionary path not configured. Set dictionary.mdxPath in config.yaml."
-        )
-    mdx_path_str = str(MDX_PATH)
-    if not MDX_PATH.exists():
-        raise FileNotFoundError(f"Dictionary file not found at {mdx_path_str}")
-
-    d = IndexBuilder(mdx_path_str)
-    if not os.path.exists(mdx_path_str + ".sqlite.db"):
-        d.make_sqlite()
-    result = d.mdx_lookup(word)
+    result = _get_index_builder().mdx_lookup(word)
     return result[0]
 
 
-def lookup_keys(word: str) -> list[str]:
+@lru_cache(maxsize=4)
+def _read_css(path: str) -> str:
+    try:
+        return Path(path).read_text(encoding="utf-8", errors="ignore")
+    except Exception:
+        return ""
+
+
+@lru_cache(maxsize=2048)
+def lookup_keys(word: str) -> tuple[str, ...]:
     w = word
     if not w:
-        return []
+        return ()
 
     # 1) exact first
     keys = [w]
 
+    # Lemmas only help single words; skip short tokens, phrases, numbers, paths.
+    if len(w) <= 2 or not w.replace("-", "").replace("'", "").isalpha():
+        return (w,)
+
     # 2) fallback lemma ONLY after exact fails
+    import simplemma  # deferred: loads language data on first use
+
     lemma = simplemma.lemmatize(w, lang="en")
     if lemma and lemma != w:
         keys.append(lemma)
@@ -85,38 +116,63 @@ def lookup_keys(word: str) -> list[str]:
         if k and k not in seen:
             out.append(k)
             seen.add(k)
-    return out
+    return tuple(out)
 
 
 class DictLookupWorker(QThread):
+    """Long-lived lookup thread fed through a queue; stop() ends the loop."""
+
     finishedLookup = Signal(str, str, object)  # word, html, err
     failedLookup = Signal(str, str)  # word, error
 
-    def __init__(
-        self, lookup_fn: Callable[[str], Tuple[str, Optional[str]]], word: str
-    ):
+    def __init__(self, lookup_fn: Callable[[str], Tuple[str, Optional[str]]]):
         super().__init__()
         self._lookup_fn = lookup_fn
-        self._word = (word or "").strip()
+        self._queue: queue.Queue[Optional[Tuple[str, int]]] = queue.Queue()
+        # Bumped by cancel_all(); queued words from older generations are skipped.
+        self._generation = 0
 
-    def run(self) -> None:
+    def submit(self, word: str) -> None:
+        self._queue.put(((word or "").strip(), self._generation))
+
+    def cancel_all(self) -> None:
+        """Drop queued lookups; one already in progress still reports back."""
+        self._generation += 1
         try:
-            if self.isInterruptionRequested():
-                return
-            html, err = self._lookup_fn(self._word)
-            if self.isInterruptionRequested():
-                return
-            self.finishedLookup.emit(self._word, html or "", err)
-        except Exception as exc:  # pylint: disable=broad-except
-            # If we were interrupted, silently exit instead of emitting failure.
-            if self.isInterruptionRequested():
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def stop(self) -> None:
+        self.requestInterruption()
+        self._queue.put(None)
+
+    def run(self) -> None:
+        while True:
+            entry = self._queue.get()
+            if entry is None or self.isInterruptionRequested():
                 return
-            self.failedLookup.emit(self._word, str(exc))
+            word, generation = entry
+            if generation != self._generation:
+                continue
+            try:
+                html, err = self._lookup_fn(word)
+                if self.isInterruptionRequested():
+                    return
+                self.finishedLookup.emit(word, html or "", err)
+            except Exception as exc:  # pylint: disable=broad-except
+                # If we were interrupted, silently exit instead of emitting failure.
+                if self.isInterruptionRequested():
+                    return
+                self.failedLookup.emit(word, str(exc))
 
 
 class DictionaryPlugin(Plugin):
     plugin_id = "dictionary"
     display_name = "Dictionary"
+    # Max looked-up words kept in memory (least recently used evicted first).
+    cache_size = 512
 
     def __init__(
         self,
@@ -127,24 +183,46 @@ class DictionaryPlugin(Plugin):
         super().__init__(group_id)
         self._preview_text_limit = preview_text_limit
         self._refresh_callback = refresh_callback
-        self._cache: Dict[str, tuple[str, Optional[str]]] = {}
+        # word -> (html, encoded html, error); bytes are kept so hits skip re-encoding.
+        self._cache: OrderedDict[
+            str, tuple[str, Optional[bytes], Optional[str]]
+        ] = OrderedDict()
         self._worker: Optional[DictLookupWorker] = None
         self._loading_word: Optional[str] = None
-        self._pending_queue: list[str] = []
-        self._oald_css = ""
-        self._dict_cfg = get_dictionary_settings()
+        self._pending_queue: deque[str] = deque()
+        self._pending_set: set[str] = set()
+        self._dict_cfg = _DICT_CFG
         self._font_family = _UI_FONT
-
         css_path = self._dict_cfg.get("cssPath")
-        if css_path:
-            try:
-                self._oald_css = (
-                    Path(css_path)
-                    .expanduser()
-                    .read_text(encoding="utf-8", errors="ignore")
-                )
-            except Exception:
-                self._oald_css = ""
+        self._css_path = str(Path(css_path).expanduser()) if css_path else None
+
+    @property
+    def _oald_css(self) -> str:
+        # Read on first lookup rather than at startup; unused plugins never touch the file.
+        return _read_css(self._css_path) if self._css_path else ""
+
+    def cache_key(self, clipboard_text: str) -> Optional[Hashable]:
+        raw = (clipboard_text or "").strip()
+        words = self._extract_lookup_words(raw) if raw else []
+        if not words:
+            return raw
+        if self._has_queue_work(words):
+            # build_items still has to queue words or start the idle worker.
+            return None
+        w = words[0]
+        # The row changes as the word moves from queued to loading to cached.
+        return raw, w in self._cache, self._loading_word == w
+
+    def _has_queue_work(self, words: list[str]) -> bool:
+        if self._loading_word is None and self._pending_queue:
+            return True
+        return any(
+            w
+            and w not in self._cache
+            and w != self._loading_word
+            and w not in self._pending_set
+            for w in words
+        )
 
     def build_items(self, clipboard_text: str) -> list[ClipItem]:
         raw = (clipboard_text or "").strip()
@@ -172,63 +250,52 @@ class DictionaryPlugin(Plugin):
                 )
             ]
 
-        # Show only the first candidate to avoid multiple plugin rows.
-        lookup_words = lookup_words
-
-        # enqueue missing words
+        # enqueue missing words; the rest are prefetched for later clipboard hits
         self._enqueue_missing(lookup_words)
 
-        items: list[ClipItem] = []
-        for w in lookup_words:
-            if w in self._cache:
-                html, err = self._cache[w]
-                preview_blob = html.encode("utf-8", errors="replace") if html else None
-                items.append(
-                    self._clip_from_html(
-                        w,
-                        html,
-                        raw,
-                        err,
-                        preview_blob=preview_blob,
-                    )
-                )
-            elif self._loading_word == w:
-                items.append(
-                    self._clip_from_html(
-                        w,
-                        self._style_message("<p>Loading dictionary...</p>"),
-                        w,
-                        None,
-                        preview_blob=None,
-                    )
-                )
-            else:
-                items.append(
-                    self._clip_from_html(
-                        w,
-                        self._style_message("<p>Queued for lookup...</p>"),
-                        w,
-                        None,
-                        preview_blob=None,
-                    )
-                )
+        # Show only the first candidate to avoid multiple plugin rows.
+        w = lookup_words[0]
+        if w in self._cache:
+            self._cache.move_to_end(w)
+            html, html_blob, err = self._cache[w]
+            item = self._clip_from_html(
+                w,
+                html,
+                raw,
+                err,
+                preview_blob=html_blob,
+            )
+        elif self._loading_word == w:
+            item = self._clip_from_html(
+                w,
+                self._style_message("<p>Loading dictionary...</p>"),
+                w,
+                None,
+                preview_blob=None,
+            )
+        else:
+            item = self._clip_from_html(
+                w,
+                self._style_message("<p>Queued for lookup...</p>"),
+                w,
+                None,
+                preview_blob=None,
+            )
 
-        if not (self._worker and self._worker.isRunning()):
-            self._start_next_pending()
+        self._start_next_pending()
 
-        return items[:1]
+        return [item]
 
     def on_clipboard_changed(self, clipboard_text: str) -> None:
         raw = (clipboard_text or "").strip()
         if not raw:
             return
         # Reset queue to latest clipboard content to avoid stale “Queued” items.
-        try:
-            if self._worker and self._worker.isRunning():
-                self._worker.requestInterruption()
-        except Exception:
-            pass
-        self._pending_queue = []
+        # A lookup already in flight is left to finish; its result is dropped.
+        if self._worker is not None:
+            self._worker.cancel_all()
+        self._pending_queue.clear()
+        self._pending_set.clear()
         self._loading_word = None
         self._enqueue_missing(self._extract_lookup_words(raw))
         self._start_next_pending()
@@ -237,8 +304,7 @@ class DictionaryPlugin(Plugin):
         worker = self._worker
         if worker and worker.isRunning():
             try:
-                worker.requestInterruption()
-                worker.quit()
+                worker.stop()
                 # Give the worker ample time to stop cleanly; fall back to terminate.
                 if not worker.wait(1500):
                     worker.terminate()
@@ -250,13 +316,13 @@ class DictionaryPlugin(Plugin):
     # Internal helpers -------------------------------------------------
     def _extract_lookup_words(self, raw: str) -> list[str]:
         # split on commas/newlines; take first token in each segment
-        segments = re.split(r"[,\n]+", raw)
+        segments = _SEGMENT_SPLIT_RE.split(raw)
         words: list[str] = []
         for seg in segments:
             seg = seg.strip()
             if not seg:
                 continue
-            toks = re.findall(r"[A-Za-z][A-Za-z'\\-]*", seg) or seg.split()
+            toks = _WORD_RE.findall(seg) or seg.split()
             if toks:
                 words.append(toks[0])
         # de-dupe keeping order; cap to 5
@@ -286,13 +352,13 @@ class DictionaryPlugin(Plugin):
                 html_body = self._style_message(
                     f"{html_body}<p style='color:#f66; font-size:14pt'>Error: {error}</p>"
                 )
-        plain = re.sub(r"<[^>]+>", " ", html_body).strip()
+        plain = _TAG_RE.sub(" ", html_body).strip()
         preview = truncate_text(plain, self._preview_text_limit)
         return ClipItem(
             id=-1000,
             content_type="html",
             content_text=plain,
-            content_blob=html_body.encode("utf-8"),
+            content_blob=preview_blob or html_body.encode("utf-8"),
             created_at=int(time.time()),
             pinned=False,
             pinned_at=None,
@@ -347,32 +413,23 @@ class DictionaryPlugin(Plugin):
                 continue
             if w in self._cache or w == self._loading_word:
                 continue
-            if w not in self._pending_queue:
+            if w not in self._pending_set:
                 self._pending_queue.append(w)
+                self._pending_set.add(w)
 
     def _start_next_pending(self) -> None:
-        if self._worker and self._worker.isRunning():
+        if self._loading_word is not None or not self._pending_queue:
             return
-        if self._worker:
-            try:
-                self._worker.finishedLookup.disconnect()
-                self._worker.failedLookup.disconnect()
-            except Exception:
-                pass
-            try:
-                self._worker.deleteLater()
-            except Exception:
-                pass
-            self._worker = None
-
-        if not self._pending_queue:
-            return
-        word = self._pending_queue.pop(0)
+        word = self._pending_queue.popleft()
+        self._pending_set.discard(word)
         self._loading_word = word
-        self._worker = DictLookupWorker(self._lookup_definition, word)
-        self._worker.finishedLookup.connect(self._on_lookup_finished)
-        self._worker.failedLookup.connect(self._on_lookup_failed)
-        self._worker.start()
+        if self._worker is None:
+            # Started on first use and reused for every later lookup.
+            self._worker = DictLookupWorker(self._lookup_definition)
+            self._worker.finishedLookup.connect(self._on_lookup_finished)
+            self._worker.failedLookup.connect(self._on_lookup_failed)
+            self._worker.start()
+        self._worker.submit(word)
 
     def _on_lookup_finished(self, word: str, html: str, err_obj) -> None:
         if self._loading_word != word:
@@ -386,7 +443,8 @@ class DictionaryPlugin(Plugin):
         )
         if (not clean_html) and html:
             clean_html = html
-        self._cache[word] = (
+        self._remember(
+            word,
             (
                 self._style_message(clean_html)
                 or self._style_message(f"<p>No definition found for <b>{word}</b>.</p>")
@@ -394,15 +452,16 @@ class DictionaryPlugin(Plugin):
             err or None,
         )
         self._loading_word = None
-        try:
-            if self._worker:
-                self._worker.deleteLater()
-        except Exception:
-            pass
-        self._worker = None
         QTimer.singleShot(0, self._refresh_callback)
         QTimer.singleShot(0, self._start_next_pending)
 
+    def _remember(self, word: str, html: str, err: Optional[str]) -> None:
+        html_blob = html.encode("utf-8", errors="replace") if html else None
+        self._cache[word] = (html, html_blob, err)
+        self._cache.move_to_end(word)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
     def _style_message(self, html: str) -> str:
         """Wrap helper messages with configured font-family."""
         safe_font = str(self._font_family).replace('"', "'")
@@ -411,16 +470,11 @@ class DictionaryPlugin(Plugin):
     def _on_lookup_failed(self, word: str, error: str) -> None:
         if self._loading_word != word:
             return
-        self._cache[word] = (
+        self._remember(
+            word,
             self._style_message(f"<p>No definition found for <b>{word}</b>.</p>"),
             error or "Lookup failed",
         )
         self._loading_word = None
-        try:
-            if self._worker:
-                self._worker.deleteLater()
-        except Exception:
-            pass
-        self._worker = None
         QTimer.singleShot(0, self._refresh_callback)
         QTimer.singleShot(0, self._start_next_pending)
@@ -1,17 +1,9 @@
 import time
-from typing import Callable, List
+from typing import Callable, Hashable, List
 
-from config import load_config
 from item import ClipItem
 
-from .base import Plugin
-
-
-def _font_family() -> str:
-    return (
-        load_config().get("ui", {}).get("fontFamily")
-        or "Cascadia Code, 'Segoe UI', sans-serif"
-    )
+from .base import Plugin, font_family, render_page
 
 
 HTML = """<!doctype html>
@@ -108,20 +100,22 @@ class FlaticonPlugin(Plugin):
         self._refresh_callback = refresh_callback
         self._pending_query: str | None = None
 
+    def cache_key(self, clipboard_text: str) -> Hashable:
+        # The manager adds the UI font to the key.
+        return (self._pending_query or "").strip()
+
     def build_items(self, clipboard_text: str) -> List[ClipItem]:
         now = int(time.time())
-        font = _font_family()
+        font = font_family()
         query = (self._pending_query or "").strip()
-        html = HTML.replace("__FONT__", font).replace(
-            "__QUERY__", query.replace('"', '\\"')
-        )
+        html_bytes, html_len = render_page(HTML, font, QUERY=query.replace('"', '\\"'))
         preview = f"Flaticon · {query}" if query else "Flaticon"
         return [
             ClipItem(
                 id=-1000,
                 content_type="html",
                 content_text="Flaticon",
-                content_blob=html.encode("utf-8"),
+                content_blob=html_bytes,
                 created_at=now,
                 pinned=False,
                 pinned_at=None,
@@ -129,7 +123,7 @@ class FlaticonPlugin(Plugin):
                 preview_text=preview,
                 preview_blob=None,
                 has_full_content=True,
-                content_length=len(html),
+                content_length=html_len,
                 collapsed_height=495,
                 expanded_height=495,
                 render_mode="web",
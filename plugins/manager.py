@@ -1,8 +1,9 @@
-from typing import Callable, List
+import time
+from typing import Callable, Hashable, List, Optional, Tuple
 
 from item import ClipItem
 
-from .base import Plugin
+from .base import Plugin, font_family
 
 
 class PluginManager:
@@ -12,13 +13,27 @@ class PluginManager:
         self.group_id = group_id
         self._clipboard_text_provider = clipboard_text_provider
         self._plugins: list[Plugin] = []
+        self._cb_text: Optional[str] = None
+        self._cb_ts = 0.0
+        # plugin_id -> (cache_key, items) from that plugin's last build.
+        self._item_cache: dict[str, Tuple[Hashable, List[ClipItem]]] = {}
 
     def register(self, plugin: Plugin) -> None:
         base = -1000 - (len(self._plugins) * 100)
-        setattr(plugin, "_id_base", base)
+        plugin._id_base = base
         self._plugins.append(plugin)
 
+    def _get_clipboard_cached(self, ttl: float = 0.05) -> str:
+        """Return clipboard text, reusing a read made within the last `ttl` seconds."""
+        now = time.monotonic()
+        if self._cb_text is None or now - self._cb_ts >= ttl:
+            self._cb_text = self._clipboard_text_provider() or ""
+            self._cb_ts = now
+        return self._cb_text
+
     def on_clipboard_changed(self, clipboard_text: str) -> None:
+        self._cb_text = clipboard_text or ""
+        self._cb_ts = time.monotonic()
         for plugin in self._plugins:
             try:
                 plugin.on_clipboard_changed(clipboard_text)
@@ -31,49 +46,87 @@ class PluginManager:
 
     def build_items(self) -> List[ClipItem]:
         clipboard_text_cache = None
+        font = font_family()
         items: list[ClipItem] = []
         for plugin in self._plugins:
             clip_txt = ""
             if getattr(plugin, "uses_clipboard", True):
                 if clipboard_text_cache is None:
-                    clipboard_text_cache = self._clipboard_text_provider() or ""
+                    clipboard_text_cache = self._get_clipboard_cached()
                 clip_txt = clipboard_text_cache
-            plugin_items = plugin.build_items(clip_txt)
-            base = getattr(plugin, "_id_base", -1000)
-            for idx, item in enumerate(plugin_items):
-                try:
-                    item.id = int(base - idx)
-                except Exception:
-                    pass
-            items.extend(plugin_items)
+            items.extend(self._build_plugin(plugin, clip_txt, font)[0])
+        return items
+
+    def build_changed_items(self, clipboard_only: bool = False) -> List[ClipItem]:
+        """
+        Items of the plugins that actually rebuilt, for incremental model updates.
+        Plugins whose cache_key still matches are left out: the models already hold
+        their items. A plugin that raises is skipped.
+        """
+        clipboard_text_cache = None
+        font = font_family()
+        items: list[ClipItem] = []
+        for plugin in self._plugins:
+            uses_clip = getattr(plugin, "uses_clipboard", True)
+            if clipboard_only and not uses_clip:
+                continue
+            clip_txt = ""
+            if uses_clip:
+                if clipboard_text_cache is None:
+                    clipboard_text_cache = self._get_clipboard_cached()
+                clip_txt = clipboard_text_cache
+            try:
+                plugin_items, rebuilt = self._build_plugin(plugin, clip_txt, font)
+            except Exception:
+                continue
+            if rebuilt:
+                items.extend(plugin_items)
         return items
 
     def build_items_for(self, plugin_id: str) -> List[ClipItem]:
         """
         Build items only for the specified plugin_id; falls back to [] on failure.
         """
-        clipboard_text_cache = None
-        out: list[ClipItem] = []
         for plugin in self._plugins:
             if getattr(plugin, "plugin_id", None) != plugin_id:
                 continue
             clip_txt = ""
             if getattr(plugin, "uses_clipboard", True):
-                if clipboard_text_cache is None:
-                    clipboard_text_cache = self._clipboard_text_provider() or ""
-                clip_txt = clipboard_text_cache
+                clip_txt = self._get_clipboard_cached()
             try:
-                plugin_items = plugin.build_items(clip_txt)
+                plugin_items = self._build_plugin(plugin, clip_txt, font_family())[0]
             except Exception:
                 plugin_items = []
-            base = getattr(plugin, "_id_base", -1000)
-            for idx, item in enumerate(plugin_items):
-                try:
-                    item.id = int(base - idx)
-                except Exception:
-                    pass
-            out.extend(plugin_items)
-        return out
+            # plugin_id is unique per registration; stop at the first match.
+            return plugin_items
+        return []
+
+    def _build_plugin(
+        self, plugin: Plugin, clip_txt: str, font: str
+    ) -> Tuple[List[ClipItem], bool]:
+        """
+        Build one plugin's items, reusing the last result while its cache_key holds.
+        Returns the items and whether build_items actually ran. The UI font (read once
+        per refresh by the caller) is part of every key, so plugins need not stat the
+        config for it.
+        """
+        key = plugin.cache_key(clip_txt)
+        if key is not None:
+            key = (font, key)
+            cached = self._item_cache.get(plugin.plugin_id)
+            if cached is not None and cached[0] == key:
+                return list(cached[1]), False
+        plugin_items = plugin.build_items(clip_txt)
+        self._assign_ids(plugin, plugin_items)
+        if key is not None:
+            self._item_cache[plugin.plugin_id] = (key, list(plugin_items))
+        return plugin_items, True
+
+    @staticmethod
+    def _assign_ids(plugin: Plugin, plugin_items: List[ClipItem]) -> None:
+        base = plugin._id_base
+        for idx, item in enumerate(plugin_items):
+            item.id = base - idx
 
     def dispatch_action(self, plugin_id: str, action_id: str, backend, payload=None) -> bool:
         for plugin in self._plugins:
@@ -1,19 +1,6 @@
-import time
-from typing import Callable, List
+from typing import Callable
 
-from config import load_config
-from item import ClipItem
-
-from .base import Plugin
-
-
-def _font_family() -> str:
-    return (
-        load_config()
-        .get("ui", {})
-        .get("fontFamily")
-        or "Cascadia Code, 'Segoe UI', sans-serif"
-    )
+from .base import StaticPagePlugin
 
 
 HTML = """<!doctype html>
@@ -38,30 +25,53 @@ HTML = """<!doctype html>
 <script>
 const canvas = document.getElementById('game');
 const ctx = canvas.getContext('2d');
+// canvas size is fixed by its attributes; read once instead of per frame
+const CW = canvas.width, CH = canvas.height;
 let groundY = 130;
 let trex = { x: 40, y: groundY, vy: 0, w: 26, h: 28, duck:false };
 let gravity = 0.7;
 let jumpV = -12;
-let obstacles = [];
+// obstacles as interleaved [x, w, h] rows in one typed array, with a live count
+const IX = 0, IW = 1, IH = 2;
+let obs = new Float32Array(3 * 16);
+let obsN = 0;
 let frame = 0;
 let speed = 6;
 let alive = true;
 let score = 0;
+// set whenever state changes; draw() is skipped otherwise (e.g. on the game-over screen)
+let dirty = true;
 
 function reset() {
-  obstacles = [];
+  obsN = 0;
   trex.y = groundY; trex.vy = 0; trex.duck=false;
   speed = 6; frame = 0; alive = true; score = 0;
+  dirty = true;
+}
+
+// xorshift32; seeded from the clock (never 0) so runs still differ
+let rngS = (Date.now() ^ 0x9E3779B1) | 0 || 1;
+function rnd() {
+  rngS ^= rngS << 13; rngS ^= rngS >>> 17; rngS ^= rngS << 5;
+  return (rngS >>> 0) / 4294967296;
 }
 
 function spawn() {
-  const h = 20 + Math.random()*30;
-  const w = 10 + Math.random()*15;
-  obstacles.push({x: canvas.width + 20, w, h});
+  const h = 20 + rnd()*30;
+  const w = 10 + rnd()*15;
+  if (3 * obsN === obs.length) {
+    const grown = new Float32Array(obs.length * 2);
+    grown.set(obs);
+    obs = grown;
+  }
+  const o = 3 * obsN;
+  obs[o + IX] = CW + 20; obs[o + IW] = w; obs[o + IH] = h;
+  obsN++;
 }
 
 function update() {
   if (!alive) return;
+  dirty = true;
   frame++;
   trex.vy += gravity;
   trex.y += trex.vy;
@@ -69,54 +79,136 @@ function update() {
   if (trex.duck) trex.h = 18; else trex.h = 28;
 
   if (frame % 80 === 0) spawn();
-  obstacles.forEach(o => o.x -= speed);
-  obstacles = obstacles.filter(o => o.x + o.w > 0);
-
-  // collisions
-  for (const o of obstacles) {
-    if (trex.x < o.x + o.w &&
-        trex.x + trex.w > o.x &&
-        trex.y < groundY &&
-        trex.y + trex.h > groundY - o.h) {
+
+  // move, prune off-screen and collide in one pass; compact in place
+  // Loop-invariant trex bounds; the right-edge test rejects most obstacles first.
+  const left = trex.x, right = trex.x + trex.w;
+  // bottom > groundY - h  <=>  h > clearance
+  const clearance = groundY - (trex.y + trex.h);
+  // Only an airborne trex can collide; on the ground (most frames) and after the
+  // first hit, the pass just moves and compacts.
+  let testing = trex.y < groundY;
+  let n = 0;
+  for (let i = 0; i < obsN; i++) {
+    const o = 3 * i;
+    const x = obs[o + IX] - speed, w = obs[o + IW], h = obs[o + IH];
+    if (x + w <= 0) continue;
+    if (testing && x < right && left < x + w && h > clearance) {
+      testing = false;
       alive = false;
     }
+    const d = 3 * n;
+    obs[d + IX] = x; obs[d + IW] = w; obs[d + IH] = h;
+    n++;
   }
+  obsN = n;
   score += 1;
   speed = 6 + Math.min(6, score / 400);
 }
 
+const FONT_SCORE = "12px __FONT__";
+const FONT_OVER = "18px __FONT__";
+let curFont = "";
+
+// Assigning ctx.font re-parses the shorthand, so only do it when the font changes.
+function setFont(f) {
+  if (curFont !== f) { ctx.font = f; curFont = f; }
+}
+
+// Rects painted last frame as flat [x, y, w, h, ...]; only these are cleared next time.
+const prevRects = [];
+let prevN = 0;
+let drawnH = -1, drawnAlive = true;
+
+// Solid sprites rendered once; blitting them avoids per-frame fillStyle parsing.
+function makeSprite(w, h, color) {
+  const c = document.createElement('canvas');
+  c.width = w; c.height = h;
+  const g = c.getContext('2d');
+  g.fillStyle = color;
+  g.fillRect(0, 0, w, h);
+  return c;
+}
+const TREX_SPRITE = makeSprite(26, 28, "#f8e45c");
+const TREX_DUCK_SPRITE = makeSprite(26, 18, "#f8e45c");
+// obstacle sizes are random, so one texel is stretched to each size
+const OBS_SPRITE = makeSprite(1, 1, "#e85d75");
+ctx.imageSmoothingEnabled = false;
+
+function paintRect(img, x, y, w, h) {
+  ctx.drawImage(img, x, y, w, h);
+  prevRects[prevN++] = x; prevRects[prevN++] = y;
+  prevRects[prevN++] = w; prevRects[prevN++] = h;
+}
+
+// Score label refreshed every 6 points (~10 Hz); exact whenever the scene is fully repainted.
+let scoreStr = "", shownScore = 0;
+
 function draw() {
-  ctx.clearRect(0,0,canvas.width,canvas.height);
+  // Ducking shifts the whole scene and game over overlays text: repaint everything then.
+  const full = trex.h !== drawnH || alive !== drawnAlive;
+  const scoreChanged = full || score - shownScore >= 6 || score < shownScore;
+  if (scoreChanged) {
+    scoreStr = "Score: " + score;
+    shownScore = score;
+  }
+  if (full) {
+    ctx.clearRect(0,0,CW,CH);
+  } else {
+    for (let i = 0; i < prevN; i += 4) {
+      ctx.clearRect(prevRects[i] - 1, prevRects[i+1] - 1, prevRects[i+2] + 2, prevRects[i+3] + 2);
+    }
+    if (scoreChanged) ctx.clearRect(518, 6, CW - 518, 20);
+  }
+  drawnH = trex.h; drawnAlive = alive;
+  prevN = 0;
+
+  // ground is redrawn every frame since cleared rects may cut into it
   ctx.fillStyle = "#2c2c2c";
-  ctx.fillRect(0,groundY+trex.h-28,canvas.width,2);
+  ctx.fillRect(0,groundY+trex.h-28,CW,2);
 
   // trex
-  ctx.fillStyle = "#f8e45c";
-  ctx.fillRect(trex.x, trex.y - trex.h + 28, trex.w, trex.h);
+  const sprite = trex.h === TREX_DUCK_SPRITE.height ? TREX_DUCK_SPRITE : TREX_SPRITE;
+  paintRect(sprite, trex.x, trex.y - trex.h + 28, trex.w, trex.h);
 
   // obstacles
-  ctx.fillStyle = "#e85d75";
-  obstacles.forEach(o => {
-    ctx.fillRect(o.x, groundY - o.h + trex.h - 28, o.w, o.h);
-  });
+  for (let o = 0; o < 3 * obsN; o += 3) {
+    const h = obs[o + IH];
+    paintRect(OBS_SPRITE, obs[o + IX], groundY - h + trex.h - 28, obs[o + IW], h);
+  }
 
   ctx.fillStyle = "#aaa";
-  ctx.font = "12px __FONT__";
-  ctx.fillText("Score: " + score.toString(), 520, 20);
+  if (scoreChanged) {
+    setFont(FONT_SCORE);
+    ctx.fillText(scoreStr, 520, 20);
+  }
   if (!alive) {
-    ctx.font = "18px __FONT__";
+    setFont(FONT_OVER);
     ctx.fillText("Game Over — press R to restart", 170, 80);
   }
 }
 
-function tick() {
-  update();
-  draw();
+// Simulate at a fixed 60 Hz regardless of display refresh; draw at most once per frame.
+const DT = 1000 / 60;
+let lastT = performance.now(), acc = 0;
+
+function tick(t = performance.now()) {
+  // Clamp so a backgrounded tab does not replay seconds of updates at once.
+  acc = Math.min(acc + (t - lastT), 250);
+  lastT = t;
+  while (acc >= DT) { update(); acc -= DT; }
+  if (dirty) { draw(); dirty = false; }
   requestAnimationFrame(tick);
 }
 
 document.addEventListener('keydown', (e)=>{
-  if (e.code === "Space" || e.code === "ArrowUp") {
+  const jumpKey = e.code === "Space" || e.code === "ArrowUp";
+  // Held keys auto-repeat; only the first press acts (still block page scroll on repeats).
+  if (e.repeat) {
+    if (jumpKey) e.preventDefault();
+    return;
+  }
+  if (jumpKey) {
     if (trex.y >= groundY - 0.1 && alive) trex.vy = jumpV;
     e.preventDefault();
   }
@@ -135,10 +227,14 @@ tick();
 """
 
 
-class TrexPlugin(Plugin):
+class TrexPlugin(StaticPagePlugin):
     plugin_id = "trex"
     display_name = "T-Rex Runner"
-    uses_clipboard = False
+    page_html = HTML
+    page_title = "T-Rex Runner"
+    page_preview = "Play the T-Rex game"
+    collapsed_height = 240
+    expanded_height = 260
 
     def __init__(
         self,
@@ -148,31 +244,5 @@ class TrexPlugin(Plugin):
         super().__init__(group_id)
         self._refresh_callback = refresh_callback
 
-    def build_items(self, clipboard_text: str) -> List[ClipItem]:
-        now = int(time.time())
-        font = _font_family()
-        html = HTML.replace("__FONT__", font)
-        return [
-            ClipItem(
-                id=-1000,
-                content_type="html",
-                content_text="T-Rex Runner",
-                content_blob=html.encode("utf-8"),
-                created_at=now,
-                pinned=False,
-                pinned_at=None,
-                group_id=self.group_id,
-                preview_text="Play the T-Rex game",
-                preview_blob=None,
-                has_full_content=True,
-                content_length=len(html),
-                collapsed_height=240,
-                expanded_height=260,
-                render_mode="web",
-                plugin_id=self.plugin_id,
-                extra_actions=[],
-            )
-        ]
-
     def on_action(self, action_id: str, backend, payload=None) -> bool:
         return False
@@ -1,5 +1,4 @@
 ﻿import atexit
-import base64
 import json
 import os
 import re
@@ -8,10 +7,11 @@ import sys
 import tempfile
 import threading
 import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Any, Callable, Iterable, Optional
 
 from PySide6.QtCore import (
     Property,
@@ -65,8 +65,65 @@ PLUGIN_CLIP_ID = -1000
 DEFAULT_VISIBLE_ITEM_LIMIT = 120
 VISIBLE_ITEM_LIMIT_STEP = 120
 
+# Color sniffing for html/color clips; compiled once since data() runs them per paint.
+# Body-level patterns run only against the opening <body ...> tag, found with one scan.
+_BODY_TAG_RE = re.compile(r"<body[^>]*", re.IGNORECASE)
+_BODY_BGCOLOR_RE = re.compile(r"<body[^>]*bgcolor=[\"']([^\"'>]+)", re.IGNORECASE)
+# Tried in order (body tag first, then the whole document); the first match that
+# parses as a color wins.
+_BODY_BG_COLOR_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.S)
+    for pattern in (
+        r"<body[^>]*style=[\"'][^\"']*background-color\s*:\s*([^;\"'>]+)",
+        r"<body[^>]*style=[\"'][^\"']*background\s*:\s*([^;\"'>]+)",
+        r"<body[^>]*bgcolor=[\"']([^\"'>]+)",
+    )
+)
+_BG_COLOR_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.S)
+    for pattern in (
+        r"<!--StartFragment-->.*?<div[^>]*style=[\"'][^\"']*background-color\s*:\s*([^;\"'>]+)",
+        r"<!--StartFragment-->.*?<div[^>]*style=[\"'][^\"']*background\s*:\s*([^;\"'>]+)",
+        r"<(?:div|pre|code|table|section|article)[^>]*style=[\"'][^\"']*background-color\s*:\s*([^;\"'>]+)",
+        r"<(?:div|pre|code|table|section|article)[^>]*style=[\"'][^\"']*background\s*:\s*([^;\"'>]+)",
+        r"<[^>]*style=[\"'][^\"']*background-color\s*:\s*([^;\"'>]+)",
+        r"<[^>]*style=[\"'][^\"']*background\s*:\s*([^;\"'>]+)",
+    )
+)
+_BODY_TEXT_COLOR_PATTERNS = (
+    re.compile(r"<body[^>]*style=[\"'][^\"']*color\s*:\s*([^;\"'>]+)", re.IGNORECASE | re.S),
+)
+_TEXT_COLOR_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.S)
+    for pattern in (
+        r"<!--StartFragment-->.*?<div[^>]*style=[\"'][^\"']*(?:^|[;\\s])color\s*:\s*([^;\"'>]+)",
+        r"<(?:div|pre|code|table|section|article|span|font|i|b|strong|em|ol|ul|li|p)[^>]*style=[\"'][^\"']*(?:^|[;\\s])color\s*:\s*([^;\"'>]+)",
+        r"<font[^>]*color=[\"']([^\"'>]+)",
+        r"<[^>]*style=[\"'][^\"']*(?:^|[;\\s])color\s*:\s*([^;\"'>]+)",
+    )
+)
+
+
+def _body_tag(html: str) -> str:
+    match = _BODY_TAG_RE.search(html)
+    return match.group(0) if match else ""
+
+
+def _first_color(html: str, body_patterns, doc_patterns) -> Optional[str]:
+    body_tag = _body_tag(html)
+    for text, patterns in ((body_tag, body_patterns), (html, doc_patterns)):
+        if not text:
+            continue
+        for pattern in patterns:
+            match = pattern.search(text)
+            if match:
+                normalized = parse_color_text(match.group(1).strip())
+                if normalized:
+                    return normalized
+    return None
+
 
-@dataclass
+@dataclass(slots=True)
 class GroupEntry:
     id: int
     name: str
@@ -83,6 +140,7 @@ class GroupListModel(QAbstractListModel):
     def __init__(self, groups: Optional[list[GroupEntry]] = None, parent=None) -> None:
         super().__init__(parent)
         self._groups: list[GroupEntry] = groups or []
+        self._special_count = self._count_special(self._groups)
 
     def rowCount(self, parent=QModelIndex()) -> int:  # type: ignore[override]
         if parent.isValid():
@@ -118,6 +176,7 @@ class GroupListModel(QAbstractListModel):
         groups_list = list(groups)
         self.beginResetModel()
         self._groups = groups_list
+        self._special_count = self._count_special(groups_list)
         self.endResetModel()
 
     def move_group(self, from_row: int, to_row: int) -> bool:
@@ -128,9 +187,9 @@ class GroupListModel(QAbstractListModel):
         if from_row >= len(self._groups) or to_row >= len(self._groups):
             return False
         # disallow moving special groups (All/Default) and disallow dropping before first user group
-        first_user = 0
-        while first_user < len(self._groups) and self._groups[first_user].is_special:
-            first_user += 1
+        # Special groups always lead the list (see refresh_groups), so their count is the
+        # index of the first user group.
+        first_user = self._special_count
         if from_row < first_user or to_row < first_user:
             return False
         self.beginMoveRows(
@@ -166,9 +225,14 @@ class GroupListModel(QAbstractListModel):
     def snapshot(self) -> list[GroupEntry]:
         return list(self._groups)
 
+    @staticmethod
+    def _count_special(groups: list[GroupEntry]) -> int:
+        return sum(1 for g in groups if getattr(g, "is_special", False))
+
     @Slot(result=int)
     def specialCount(self) -> int:
-        return sum(1 for g in self._groups if getattr(g, "is_special", False))
+        # Maintained by set_groups; move_group never moves a special group.
+        return self._special_count
 
 
 class GroupSliceModel(QAbstractListModel):
@@ -247,19 +311,90 @@ class ClipListModel(QAbstractListModel):
     ExtraActionsRole = Qt.UserRole + 23
     LastUsedRole = Qt.UserRole + 24
 
+    # Clips whose decoded html / colors / preview url are kept (least recently read evicted).
+    _DERIVED_CACHE_SIZE = 512
+
+    # Roles refreshed when a clip is replaced in place.
+    _UPDATE_ROLES = [
+        LabelRole,
+        TypeRole,
+        ContentRole,
+        ContentBlobRole,
+        HtmlRole,
+        PreviewRole,
+        FullPreviewRole,
+        PreviewTextRole,
+        TooltipRole,
+        BaseColorRole,
+        TextColorRole,
+        ColorHexRole,
+        ColorTextRole,
+        HasFullRole,
+        ContentLengthRole,
+        CollapsedHeightRole,
+        ExpandedHeightRole,
+        RenderModeRole,
+        PluginIdRole,
+        ExtraActionsRole,
+    ]
+    # ClipItem field -> roles derived from it; a content_type change refreshes every role.
+    # Every field a label() override reads maps to LabelRole (ImageItem sizes come from blobs).
+    _FIELD_ROLES = (
+        ("content_text", (LabelRole, ContentRole, BaseColorRole, ColorHexRole, ColorTextRole)),
+        (
+            "content_blob",
+            (
+                LabelRole,
+                ContentBlobRole,
+                HtmlRole,
+                PreviewRole,
+                FullPreviewRole,
+                BaseColorRole,
+                TextColorRole,
+                ColorHexRole,
+                ColorTextRole,
+            ),
+        ),
+        ("preview_text", (LabelRole, ContentRole, PreviewTextRole)),
+        (
+            "preview_blob",
+            (
+                LabelRole,
+                ContentBlobRole,
+                HtmlRole,
+                PreviewRole,
+                FullPreviewRole,
+                BaseColorRole,
+                TextColorRole,
+                ColorHexRole,
+                ColorTextRole,
+            ),
+        ),
+        ("has_full_content", (ContentRole, HasFullRole)),
+        ("content_length", (ContentLengthRole,)),
+        ("collapsed_height", (CollapsedHeightRole,)),
+        ("expanded_height", (ExpandedHeightRole,)),
+        ("render_mode", (RenderModeRole,)),
+        ("plugin_id", (PluginIdRole, BaseColorRole)),
+        ("extra_actions", (ExtraActionsRole,)),
+    )
+
     def __init__(self, clips: Optional[list[ClipItem]] = None, parent=None) -> None:
         super().__init__(parent)
-        self._clips: list[ClipItem] = clips or []
-        self._clip_by_id: dict[int, ClipItem] = {
-            int(c.id): c for c in (clips or []) if getattr(c, "id", None) is not None
-        }
-        self._row_by_id: dict[int, int] = {
-            int(c.id): idx
-            for idx, c in enumerate(clips or [])
-            if getattr(c, "id", None) is not None
-        }
+        # Always a private copy: models are often seeded from another model's rows, and a
+        # shared list would let one model's update hide the change from the other.
+        self._clips: list[ClipItem] = list(clips or [])
+        self._clip_by_id: dict[int, ClipItem] = {}
+        self._row_by_id: dict[int, int] = {}
+        self._index_clips()
         self._subitems: dict[int, list[dict]] = {}
         self._tooltips: dict[int, str] = {}
+        # clip id -> {role key: derived value}; dropped when the clip is replaced.
+        self._derived: OrderedDict[int, dict[str, Any]] = OrderedDict()
+        # (kind, clip id) -> bytes behind the last image:// url handed out. ClipImageProvider
+        # reads it from the QML loader thread, so it never touches the clip lists directly.
+        self._image_bytes: dict[tuple[str, int], bytes] = {}
+        self._image_lock = threading.Lock()
 
     def rowCount(self, parent=QModelIndex()) -> int:  # type: ignore[override]
         if parent.isValid():
@@ -272,62 +407,54 @@ class ClipListModel(QAbstractListModel):
         row = index.row()
         if row < 0 or row >= len(self._clips):
             return None
-        clip = self._clips[row]
-        if role == self.IdRole:
-            return int(clip.id)
-        if role == self.LabelRole:
-            return clip.label()
-        if role == self.TypeRole:
-            return clip.content_type
-        if role == self.ContentRole:
-            return clip.content_text if clip.has_full_content else clip.preview_text
-        if role == self.CreatedRole:
-            return int(clip.created_at) * 1000  # QML expects ms
-        if role == self.LastUsedRole:
-            return (
-                int(clip.last_used_at) * 1000 if clip.last_used_at is not None else None
-            )
-        if role == self.PinnedRole:
-            return bool(clip.pinned)
-        if role == self.GroupRole:
-            return int(clip.group_id)
-        if role == self.PreviewRole:
-            return self._preview_url(clip)
-        if role == self.FullPreviewRole:
-            return self._full_preview_url(clip)
-        if role == self.SubitemsRole:
-            return self._subitems.get(int(clip.id), [])
-        if role == self.TooltipRole:
-            return self._tooltips.get(int(clip.id), "")
-        if role == self.ContentBlobRole:
-            return self._html_content(clip)
-        if role == self.HtmlRole:
-            return self._html_content(clip)
-        if role == self.ColorHexRole:
-            return self._color_data(clip)[0]
-        if role == self.ColorTextRole:
-            return self._color_data(clip)[1]
-        if role == self.BaseColorRole:
+        handler = self._ROLE_HANDLERS.get(role)
+        if handler is None:
+            return None
+        return handler(self, self._clips[row])
+
+    def _base_color(self, clip: ClipItem) -> str:
+        if clip.plugin_id:
+            # Plugin colors follow PLUGIN_BASE_COLORS, which changes without a clip update.
             return self._extract_global_bg_color(clip) or ""
-        if role == self.TextColorRole:
-            return self._extract_global_text_color(clip) or ""
-        if role == self.PreviewTextRole:
-            return clip.preview_text
-        if role == self.HasFullRole:
-            return bool(getattr(clip, "has_full_content", True))
-        if role == self.ContentLengthRole:
-            return int(getattr(clip, "content_length", 0))
-        if role == self.CollapsedHeightRole:
-            return int(getattr(clip, "collapsed_height", 0) or 0)
-        if role == self.ExpandedHeightRole:
-            return int(getattr(clip, "expanded_height", 0) or 0)
-        if role == self.RenderModeRole:
-            return str(getattr(clip, "render_mode", "") or "")
-        if role == self.PluginIdRole:
-            return str(getattr(clip, "plugin_id", "") or "")
-        if role == self.ExtraActionsRole:
-            return getattr(clip, "extra_actions", []) or []
-        return None
+        return self._derived_value(clip, "base_color", self._extract_global_bg_color) or ""
+
+    # role -> handler(model, clip); QML calls data() once per bound role per row.
+    _ROLE_HANDLERS: dict[int, Callable[["ClipListModel", ClipItem], Any]] = {
+        IdRole: lambda self, clip: clip.id,
+        LabelRole: lambda self, clip: clip.label(),
+        TypeRole: lambda self, clip: clip.content_type,
+        ContentRole: lambda self, clip: (
+            clip.content_text if clip.has_full_content else clip.preview_text
+        ),
+        CreatedRole: lambda self, clip: int(clip.created_at) * 1000,  # QML expects ms
+        LastUsedRole: lambda self, clip: (
+            int(clip.last_used_at) * 1000 if clip.last_used_at is not None else None
+        ),
+        PinnedRole: lambda self, clip: bool(clip.pinned),
+        GroupRole: lambda self, clip: int(clip.group_id),
+        PreviewRole: lambda self, clip: self._derived_value(clip, "preview", self._preview_url),
+        FullPreviewRole: lambda self, clip: self._full_preview_url(clip),
+        SubitemsRole: lambda self, clip: self._subitems.get(clip.id, []),
+        TooltipRole: lambda self, clip: self._tooltips.get(clip.id, ""),
+        ContentBlobRole: lambda self, clip: self._derived_value(clip, "html", self._html_content),
+        HtmlRole: lambda self, clip: self._derived_value(clip, "html", self._html_content),
+        ColorHexRole: lambda self, clip: self._derived_value(clip, "color", self._color_data)[0],
+        ColorTextRole: lambda self, clip: self._derived_value(clip, "color", self._color_data)[1],
+        BaseColorRole: lambda self, clip: self._base_color(clip),
+        TextColorRole: lambda self, clip: (
+            self._derived_value(clip, "text_color", self._extract_global_text_color) or ""
+        ),
+        PreviewTextRole: lambda self, clip: clip.preview_text,
+        # ClipItem declares these with typed defaults and item_from_row coerces DB values,
+        # so plain attribute reads are safe here.
+        HasFullRole: lambda self, clip: clip.has_full_content,
+        ContentLengthRole: lambda self, clip: clip.content_length,
+        CollapsedHeightRole: lambda self, clip: clip.collapsed_height,
+        ExpandedHeightRole: lambda self, clip: clip.expanded_height,
+        RenderModeRole: lambda self, clip: clip.render_mode,
+        PluginIdRole: lambda self, clip: clip.plugin_id,
+        ExtraActionsRole: lambda self, clip: clip.extra_actions,
+    }
 
     def roleNames(self) -> dict[int, bytes]:  # type: ignore[override]
         return {
@@ -366,81 +493,153 @@ class ClipListModel(QAbstractListModel):
         tooltips: Optional[dict[int, str]] = None,
     ) -> None:
         self.beginResetModel()
-        self._clips = clips
-        self._clip_by_id = {
-            int(c.id): c for c in clips if getattr(c, "id", None) is not None
-        }
-        self._row_by_id = {
-            int(c.id): idx
-            for idx, c in enumerate(clips)
-            if getattr(c, "id", None) is not None
-        }
+        self._clips = list(clips)
+        self._index_clips()
         self._subitems = subitems or {}
         self._tooltips = tooltips or {}
+        self._derived.clear()
+        with self._image_lock:
+            self._image_bytes.clear()
         self.endResetModel()
 
+    def _index_clips(self) -> None:
+        """Rebuild the id -> clip and id -> row lookups in a single pass."""
+        clip_by_id: dict[int, ClipItem] = {}
+        row_by_id: dict[int, int] = {}
+        for idx, c in enumerate(self._clips):
+            cid = c.id
+            if cid is None:
+                continue
+            if type(cid) is not int:
+                # Coerced once on the way in; role handlers and lookups use ids as-is.
+                cid = c.id = int(cid)
+            clip_by_id[cid] = c
+            row_by_id[cid] = idx
+        self._clip_by_id = clip_by_id
+        self._row_by_id = row_by_id
+
+    def snapshot(self) -> list[ClipItem]:
+        return list(self._clips)
+
     def clip_for_id(self, cid: int) -> Optional[ClipItem]:
         return self._clip_by_id.get(int(cid))
 
     @Slot(int, result=int)
     def idAt(self, row: int) -> int:
         if 0 <= row < len(self._clips):
-            return int(self._clips[row].id)
+            return self._clips[row].id
         return -1
 
     @Slot(int, result=int)
     def rowForId(self, cid: int) -> int:
-        return int(self._row_by_id.get(int(cid), -1))
+        return self._row_by_id.get(cid, -1)
 
     @Slot(int, result=int)
     def indexOfId(self, cid: int) -> int:
-        return int(self._row_by_id.get(int(cid), -1))
+        return self._row_by_id.get(cid, -1)
 
     def update_clip(self, clip: ClipItem) -> None:
-        cid = int(getattr(clip, "id", -1))
+        replaced = self._replace_clip(clip)
+        if replaced is None or not replaced[1]:
+            return
+        row, roles = replaced
+        idx = self.index(row, 0)
+        self.dataChanged.emit(idx, idx, roles)
+
+    def update_clips_bulk(self, clips: Iterable[ClipItem]) -> None:
+        """Replace several clips, emitting one dataChanged per run of adjacent rows with
+        the union of their changed roles."""
+        changed = sorted(
+            replaced
+            for replaced in (self._replace_clip(clip) for clip in clips)
+            if replaced is not None and replaced[1]
+        )
+        if not changed:
+            return
+        start = prev = changed[0][0]
+        roles = set(changed[0][1])
+        for row, row_roles in changed[1:]:
+            if row <= prev + 1:
+                prev = row
+                roles.update(row_roles)
+                continue
+            self._emit_rows_changed(start, prev, roles)
+            start = prev = row
+            roles = set(row_roles)
+        self._emit_rows_changed(start, prev, roles)
+
+    def _emit_rows_changed(self, first: int, last: int, roles: set[int]) -> None:
+        ordered = [role for role in self._UPDATE_ROLES if role in roles]
+        self.dataChanged.emit(self.index(first, 0), self.index(last, 0), ordered)
+
+    def _changed_roles(self, old: ClipItem, new: ClipItem) -> list[int]:
+        """Roles whose values may differ between two versions of the same clip."""
+        if old.content_type != new.content_type:
+            return self._UPDATE_ROLES
+        roles: set[int] = set()
+        for name, field_roles in self._FIELD_ROLES:
+            if getattr(old, name) != getattr(new, name):
+                roles.update(field_roles)
+        return [role for role in self._UPDATE_ROLES if role in roles]
+
+    def _replace_clip(self, clip: ClipItem) -> Optional[tuple[int, list[int]]]:
+        """Swap in an updated clip for its existing row; returns (row, changed roles), or
+        None when the clip is unknown or unchanged.
+
+        Receiving the model's own object back means it was mutated in place: it cannot be
+        diffed, so its derived values are dropped and every update role is reported.
+        """
+        cid = clip.id
+        if cid is None:
+            print("invalid clip id, cannot update", cid)
+            return None
+        if type(cid) is not int:
+            cid = clip.id = int(cid)
         if cid == -1:
             print("invalid clip id, cannot update", cid)
-            return
+            return None
         row = self._row_by_id.get(cid)
         if row is None:
             print("clip id not found in model, cannot update")
-            return
+            return None
         existing = self._clips[row]
         if not getattr(clip, "preview_text", None):
             clip.preview_text = getattr(existing, "preview_text", "")
         if getattr(clip, "preview_blob", None) is None:
             clip.preview_blob = getattr(existing, "preview_blob", None)
+        # Plugins often re-emit identical items; dataclass equality compares field
+        # tuples, so shared blobs are matched by identity before any byte compare.
+        if clip is not existing and clip == existing:
+            return None
+        roles = self._UPDATE_ROLES if clip is existing else self._changed_roles(existing, clip)
         self._clips[row] = clip
         self._clip_by_id[cid] = clip
         self._row_by_id[cid] = row
-        idx = self.index(row, 0)
-        roles = [
-            self.LabelRole,
-            self.TypeRole,
-            self.ContentRole,
-            self.ContentBlobRole,
-            self.HtmlRole,
-            self.PreviewRole,
-            self.FullPreviewRole,
-            self.PreviewTextRole,
-            self.TooltipRole,
-            self.BaseColorRole,
-            self.TextColorRole,
-            self.ColorHexRole,
-            self.ColorTextRole,
-            self.HasFullRole,
-            self.ContentLengthRole,
-            self.CollapsedHeightRole,
-            self.ExpandedHeightRole,
-            self.RenderModeRole,
-            self.PluginIdRole,
-            self.ExtraActionsRole,
-        ]
-        self.dataChanged.emit(idx, idx, roles)
+        self._derived.pop(cid, None)
+        return row, roles
+
+    def _derived_value(
+        self, clip: ClipItem, key: str, compute: Callable[[ClipItem], Any]
+    ) -> Any:
+        """Memoize a value derived from the clip's blobs; QML re-reads roles on every paint."""
+        cid = clip.id
+        entry = self._derived.get(cid)
+        if entry is None:
+            entry = self._derived[cid] = {}
+            while len(self._derived) > self._DERIVED_CACHE_SIZE:
+                self._derived.popitem(last=False)
+        else:
+            self._derived.move_to_end(cid)
+        try:
+            return entry[key]
+        except KeyError:
+            value = entry[key] = compute(clip)
+            return value
 
-    def _preview_url(self, clip: ClipItem) -> str:
+    @staticmethod
+    def _preview_source(clip: ClipItem) -> tuple[Optional[bytes], str]:
         if clip.content_type not in ("image", "svg+xml", "drawio"):
-            return ""
+            return None, ""
         data: Optional[bytes] = None
         mime = "image/png"
         if clip.content_type == "drawio":
@@ -458,32 +657,50 @@ class ClipListModel(QAbstractListModel):
         elif clip.content_type == "image" and clip.content_blob:
             data = clip.content_blob
             mime = "image/png"
+        return data, mime
+
+    @staticmethod
+    def _full_preview_source(clip: ClipItem) -> tuple[Optional[bytes], str]:
+        if clip.content_type not in ("image", "svg+xml", "drawio"):
+            return None, ""
+        if clip.content_type == "svg+xml" and clip.content_blob:
+            return clip.content_blob, "image/svg+xml"
+        if clip.content_blob:
+            return clip.content_blob, "image/png"
+        return None, ""
+
+    def image_bytes(self, kind: str, cid: int) -> Optional[bytes]:
+        """Bytes behind an image://clips url; safe to call from the QML loader thread."""
+        with self._image_lock:
+            return self._image_bytes.get((kind, cid))
+
+    def _image_url(self, clip: ClipItem, kind: str, data: bytes, mime: str) -> str:
+        if mime == "image/svg+xml":
+            # SVG stays inline: decoding it through QImage would rasterize at a fixed size.
+            try:
+                encoded = QByteArray(data).toBase64()
+                return f"data:{mime};base64,{encoded.data().decode('ascii')}"
+            except Exception:
+                return ""
+        # Raster previews are served by ClipImageProvider. The content hash (cached on the
+        # bytes object after first use) keeps QML's image cache valid across model resets
+        # but changes when a clip's blob is replaced.
+        digest = hash(data) & 0xFFFFFFFFFFFFFFFF
+        with self._image_lock:
+            self._image_bytes[(kind, clip.id)] = data
+        return f"image://clips/{kind}/{clip.id}/{digest:x}"
+
+    def _preview_url(self, clip: ClipItem) -> str:
+        data, mime = self._preview_source(clip)
         if not data:
             return ""
-        try:
-            encoded = base64.b64encode(data).decode("ascii")
-            return f"data:{mime};base64,{encoded}"
-        except Exception:
-            return ""
+        return self._image_url(clip, "preview", data, mime)
 
     def _full_preview_url(self, clip: ClipItem) -> str:
-        if clip.content_type not in ("image", "svg+xml", "drawio"):
-            return ""
-        data: Optional[bytes] = None
-        mime = "image/png"
-        if clip.content_type == "svg+xml" and clip.content_blob:
-            data = clip.content_blob
-            mime = "image/svg+xml"
-        elif clip.content_blob:
-            data = clip.content_blob
-            mime = "image/png"
+        data, mime = self._full_preview_source(clip)
         if not data:
             return self._preview_url(clip)
-        try:
-            encoded = base64.b64encode(data).decode("ascii")
-            return f"data:{mime};base64,{encoded}"
-        except Exception:
-            return self._preview_url(clip)
+        return self._image_url(clip, "full", data, mime)
 
     @staticmethod
     def _html_content(clip: ClipItem) -> str:
@@ -511,7 +728,7 @@ class ClipListModel(QAbstractListModel):
         if blob:
             try:
                 html = blob.decode("utf-8", errors="replace")
-                m = re.search(r"<body[^>]*bgcolor=[\"']([^\"'>]+)", html, re.IGNORECASE)
+                m = _BODY_BGCOLOR_RE.search(_body_tag(html))
                 if m:
                     hex_value = m.group(1).strip()
             except Exception:
@@ -538,25 +755,7 @@ class ClipListModel(QAbstractListModel):
             except Exception:
                 return None
 
-            patterns = [
-                r"<body[^>]*style=[\"'][^\"']*background-color\s*:\s*([^;\"'>]+)",
-                r"<body[^>]*style=[\"'][^\"']*background\s*:\s*([^;\"'>]+)",
-                r"<body[^>]*bgcolor=[\"']([^\"'>]+)",
-                r"<!--StartFragment-->.*?<div[^>]*style=[\"'][^\"']*background-color\s*:\s*([^;\"'>]+)",
-                r"<!--StartFragment-->.*?<div[^>]*style=[\"'][^\"']*background\s*:\s*([^;\"'>]+)",
-                r"<(?:div|pre|code|table|section|article)[^>]*style=[\"'][^\"']*background-color\s*:\s*([^;\"'>]+)",
-                r"<(?:div|pre|code|table|section|article)[^>]*style=[\"'][^\"']*background\s*:\s*([^;\"'>]+)",
-                r"<[^>]*style=[\"'][^\"']*background-color\s*:\s*([^;\"'>]+)",
-                r"<[^>]*style=[\"'][^\"']*background\s*:\s*([^;\"'>]+)",
-            ]
-            for pattern in patterns:
-                match = re.search(pattern, html, re.IGNORECASE | re.S)
-                if match:
-                    raw_color = match.group(1).strip()
-                    normalized = parse_color_text(raw_color)
-                    if normalized:
-                        return normalized
-            return None
+            return _first_color(html, _BODY_BG_COLOR_PATTERNS, _BG_COLOR_PATTERNS)
         if clip.content_type == "color":
             hex_value, _ = ClipListModel._color_data(clip)
             return hex_value or None
@@ -574,21 +773,7 @@ class ClipListModel(QAbstractListModel):
         except Exception:
             return None
 
-        patterns = [
-            r"<body[^>]*style=[\"'][^\"']*color\s*:\s*([^;\"'>]+)",
-            r"<!--StartFragment-->.*?<div[^>]*style=[\"'][^\"']*(?:^|[;\\s])color\s*:\s*([^;\"'>]+)",
-            r"<(?:div|pre|code|table|section|article|span|font|i|b|strong|em|ol|ul|li|p)[^>]*style=[\"'][^\"']*(?:^|[;\\s])color\s*:\s*([^;\"'>]+)",
-            r"<font[^>]*color=[\"']([^\"'>]+)",
-            r"<[^>]*style=[\"'][^\"']*(?:^|[;\\s])color\s*:\s*([^;\"'>]+)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, html, re.IGNORECASE | re.S)
-            if match:
-                raw_color = match.group(1).strip()
-                normalized = parse_color_text(raw_color)
-                if normalized:
-                    return normalized
-        return None
+        return _first_color(html, _BODY_TEXT_COLOR_PATTERNS, _TEXT_COLOR_PATTERNS)
 
 
 class OperationWorker(QThread):
@@ -651,6 +836,12 @@ class Backend(QObject):
         self._search_timer = QTimer(self)
         self._search_timer.setSingleShot(True)
         self._search_timer.timeout.connect(self.refresh_items)
+        # Plugin refresh requests made within one event-loop turn collapse into one rebuild.
+        self._plugin_refresh_args: Optional[tuple[bool, bool]] = None
+        self._plugin_refresh_timer = QTimer(self)
+        self._plugin_refresh_timer.setSingleShot(True)
+        self._plugin_refresh_timer.setInterval(0)
+        self._plugin_refresh_timer.timeout.connect(self._flush_plugin_refresh)
         self._clipboard = QGuiApplication.clipboard()
         self._clipboard.dataChanged.connect(self._on_clipboard_changed)
         self.clipboardExtracted.connect(self._handle_clip_future)
@@ -918,57 +1109,57 @@ class Backend(QObject):
             return clips
 
         # Incremental refresh: update only needed plugins to avoid destroying alive WebEngineViews.
-        clipboard_cache = None
+        # The manager skips plugins whose cache_key still matches what the models show.
         changed = False
         updated_items: list[ClipItem] = []
-        for plugin in self.plugin_manager.plugins:
-            uses_clip = getattr(plugin, "uses_clipboard", True)
-            if clipboard_only and not uses_clip:
-                continue
-            clip_txt = ""
-            if uses_clip:
-                if clipboard_cache is None:
-                    clipboard_cache = self._clipboard_text_for_plugins()
-                clip_txt = clipboard_cache
-            try:
-                items = plugin.build_items(clip_txt)
-            except Exception:
-                continue
-            for item in items:
-                print(
-                    "Updating item from plugin:",
-                    plugin.plugin_id,
-                    "Item ID:",
-                    getattr(item, "id", None),
-                )
-                cid = int(getattr(item, "id", -1))
-                if self.plugin_clip_model.clip_for_id(cid):
-                    self.plugin_clip_model.update_clip(item)
-                    updated_items.append(item)
-                else:
-                    changed = True
+        for item in self.plugin_manager.build_changed_items(clipboard_only=clipboard_only):
+            print("Updating item from plugin:", item.plugin_id, "Item ID:", item.id)
+            cid = int(getattr(item, "id", -1))
+            if self.plugin_clip_model.clip_for_id(cid):
+                updated_items.append(item)
+            else:
+                changed = True
 
         # If any item was missing (new plugin etc.), fall back to full rebuild.
         if changed:
             clips = _build_all()
         else:
-            clips = self.plugin_clip_model._clips  # type: ignore[attr-defined]
+            self.plugin_clip_model.update_clips_bulk(updated_items)
+            clips = self.plugin_clip_model.snapshot()
 
         # Keep legacy clip_model in sync while plugins group is active.
         if self._current_group_id == PLUGIN_GROUP_ID:
+            synced: list[ClipItem] = []
             for item in updated_items:
                 cid = int(getattr(item, "id", -1))
                 if self.clip_model.clip_for_id(cid):
-                    self.clip_model.update_clip(item)
+                    synced.append(item)
                 else:
                     changed = True
             if changed:
                 self.clip_model.set_clips(clips, subitems={}, tooltips={})
+            else:
+                self.clip_model.update_clips_bulk(synced)
 
         return clips
 
     def _refresh_plugins(self, clipboard_only: bool = True, full: bool = False) -> None:
-        """Rebuild plugin rows; defaults to updating only clipboard-driven plugins."""
+        """Schedule a plugin row rebuild; defaults to updating only clipboard-driven plugins."""
+        pending = self._plugin_refresh_args
+        if pending is not None:
+            # Merge with the queued request so the single rebuild covers both.
+            clipboard_only = clipboard_only and pending[0]
+            full = full or pending[1]
+        self._plugin_refresh_args = (clipboard_only, full)
+        if not self._plugin_refresh_timer.isActive():
+            self._plugin_refresh_timer.start()
+
+    def _flush_plugin_refresh(self) -> None:
+        args = self._plugin_refresh_args
+        self._plugin_refresh_args = None
+        if args is None:
+            return
+        clipboard_only, full = args
         clips = self.refresh_plugin_items(full=full, clipboard_only=clipboard_only)
         if self._current_group_id == PLUGIN_GROUP_ID:
             # Keep the main clip model in sync while the Plugins tab is active.
@@ -994,23 +1185,21 @@ class Backend(QObject):
             return
         if not items:
             return
-        for item in items:
-            cid = int(getattr(item, "id", -1))
-            if self.plugin_clip_model.clip_for_id(cid):
-                self.plugin_clip_model.update_clip(item)
+        ids = [int(getattr(item, "id", -1)) for item in items]
+        if not all(self.plugin_clip_model.clip_for_id(cid) for cid in ids):
+            # If missing, fall back to full refresh for safety.
+            self.refresh_plugin_items(full=True)
+            return
+        self.plugin_clip_model.update_clips_bulk(items)
+        if self._current_group_id == PLUGIN_GROUP_ID:
+            if all(self.clip_model.clip_for_id(cid) for cid in ids):
+                self.clip_model.update_clips_bulk(items)
             else:
-                # If missing, fall back to full refresh for safety.
-                self.refresh_plugin_items(full=True)
-                return
-            if self._current_group_id == PLUGIN_GROUP_ID:
-                if self.clip_model.clip_for_id(cid):
-                    self.clip_model.update_clip(item)
-                else:
-                    self.clip_model.set_clips(
-                        self.plugin_clip_model._clips,  # type: ignore[attr-defined]
-                        subitems={},
-                        tooltips={},
-                    )
+                self.clip_model.set_clips(
+                    self.plugin_clip_model.snapshot(),
+                    subitems={},
+                    tooltips={},
+                )
 
     def plugin_set_clipboard_and_paste(self, text: str) -> None:
         """Helper for plugins to push text and paste."""
@@ -0,0 +1,73 @@
+from typing import Iterable, Optional
+
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QSize
+from PySide6.QtGui import QImage, QImageReader
+from PySide6.QtQuick import QQuickImageProvider
+
+
+class ClipImageProvider(QQuickImageProvider):
+    """
+    Serves clip previews for image://clips/<preview|full>/<clip id>/<hash> urls.
+    Images are decoded straight from the stored blobs, so QML never sees a base64 data url.
+    Runs on the QML loader thread: bytes come from the models' lock-guarded image map.
+    """
+
+    def __init__(self, models: Iterable) -> None:
+        super().__init__(QQuickImageProvider.ImageType.Image)
+        # ClipListModels searched in order; plugin and stored clip ids do not overlap.
+        self._models = list(models)
+
+    def requestImage(self, image_id: str, size, requested_size) -> QImage:  # type: ignore[override]
+        parts = image_id.split("/")
+        try:
+            kind, cid = parts[0], int(parts[1])
+        except (IndexError, ValueError):
+            return QImage()
+        data = None
+        for model in self._models:
+            data = model.image_bytes(kind, cid)
+            if data:
+                break
+        if not data:
+            return QImage()
+        buffer = QBuffer()
+        buffer.setData(QByteArray(data))
+        buffer.open(QIODevice.ReadOnly)
+        reader = QImageReader(buffer)
+        original = reader.size()
+        if original.isValid():
+            # Decode straight at the requested size instead of scaling a full-size image.
+            target = self._scaled_size(original, requested_size)
+            if target is not None:
+                reader.setScaledSize(target)
+        image = reader.read()
+        if image.isNull():
+            return QImage()
+        if not original.isValid():
+            original = image.size()
+        if size is not None:
+            # Report the source dimensions, not the scaled ones.
+            size.setWidth(original.width())
+            size.setHeight(original.height())
+        return image
+
+    @staticmethod
+    def _scaled_size(original: QSize, requested: QSize) -> Optional[QSize]:
+        """Aspect-preserving downscale of `original` to fit `requested`; None keeps it as-is.
+
+        A zero width or height in `requested` (e.g. sourceSize.width only) is unconstrained.
+        """
+        if requested is None:
+            return None
+        width, height = original.width(), original.height()
+        scales = []
+        if requested.width() > 0:
+            scales.append(requested.width() / width)
+        if requested.height() > 0:
+            scales.append(requested.height() / height)
+        if not scales:
+            return None
+        scale = min(scales)
+        if scale >= 1.0:
+            return None
+        return QSize(max(1, round(width * scale)), max(1, round(height * scale)))
@@ -1605,8 +1605,11 @@ ApplicationWindow {
                                                             var sw = Math.max(1, contentPanel.width - 16);
                                                             var sh = Math.max(1, targetHeight);
                                                             img.sourceSize = Qt.size(sw, sh);
-                                                        } else if (img.sourceSize.width > 0 || img.sourceSize.height > 0) {
-                                                            img.sourceSize = Qt.size(0, 0); // reset for raster types
+                                                        } else if (img.source !== "") {
+                                                            // Raster: the image://clips provider decodes down to the panel width.
+                                                            var rw = Math.max(1, Math.round((contentPanel.width - 16) * Screen.devicePixelRatio));
+                                                            if (img.sourceSize.width !== rw || img.sourceSize.height !== 0)
+                                                                img.sourceSize = Qt.size(rw, 0);
                                                         }
                                                     }
 